@@ -319,6 +319,7 @@ class ConfigManager:
                 "timeout": 300,
                 "max_retries": 3,
                 "retry_delay": 2,
+                "batch_workers": 8,  # 批量启动/暂停/删除任务的并发线程数
                 "encrypt_api_key": True,
                 "api_keys": {
                     "huggingface": "",
@@ -332,6 +333,7 @@ class ConfigManager:
                 "csv_delimiter": ",",
                 "json_indent": 2,
                 "dedup_threshold": 0.95,
+                "clean_workers": 0,  # JSONL 清洗进程数，0 为自动，1 为不使用多进程
                 "max_file_size": 1073741824  # 1GB
             },
             
@@ -531,9 +533,11 @@ class ConfigManager:
             numeric_configs = [
                 ('download.timeout', int, 1, 3600),
                 ('download.max_retries', int, 1, 10),
+                ('download.batch_workers', int, 1, 64),
                 ('download.chunk_size', int, 1024, 10485760),  # 1KB - 10MB
                 ('process.chunk_size', int, 100, 100000),
                 ('process.dedup_threshold', float, 0.0, 1.0),
+                ('process.clean_workers', int, 0, 64),
                 ('distill.batch_size', int, 1, 1000),
                 ('distill.max_workers', int, 1, 32),
                 ('log.max_file_size', int, 1024, 1073741824),  # 1KB - 1GB
@@ -25,11 +25,16 @@ import os
 import json
 import re
 import time
+import unicodedata
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, Set
+from typing import Dict, Any, Optional, List, Union, Set, Tuple, Sequence, Collection
 from difflib import SequenceMatcher
-from .dependencies import pd
+from functools import lru_cache
+from .dependencies import pd, ahocorasick, re2
 
 # 导入统一异常类
 try:
@@ -50,7 +55,7 @@ try:
     from .config_manager import config_manager
     from .log_manager import log_manager
     from .state_manager import state_manager
-    from .utils import FileOperations, DataProcessing
+    from .utils import FileOperations, DataProcessing, json_loads
 except ImportError:
     # 直接运行时使用绝对导入
     import sys
@@ -59,7 +64,178 @@ except ImportError:
     from config_manager import config_manager
     from log_manager import log_manager
     from state_manager import state_manager
-    from utils import FileOperations, DataProcessing
+    from utils import FileOperations, DataProcessing, json_loads
+
+
+@lru_cache(maxsize=128)
+def _lower_words(words: Tuple[str, ...]) -> Tuple[str, ...]:
+    """敏感词小写表（按词表缓存，供忽略大小写的普通模式使用）"""
+    return tuple(w.lower() for w in words)
+
+
+@lru_cache(maxsize=32)
+def _word_automaton(words: Tuple[str, ...]):
+    """构建敏感词 Aho-Corasick 自动机（需 pyahocorasick，不可用时返回 None）
+
+    自动机的值为词条下标元组（同一词条可能在词表中重复出现）。
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, w in enumerate(words):
+        automaton.add_word(w, automaton.get(w, ()) + (idx,))
+    automaton.make_automaton()
+    return automaton
+
+
+def _replace_literal_ci(text: str, text_lower: str, word_lower: str, repl: str) -> Tuple[str, int]:
+    """在小写副本上用 str.find 定位词条，并按相同位置替换原文
+
+    要求 text 与 text_lower 等长（逐字符对应），返回 (新文本, 替换次数)。
+    """
+    pieces: List[str] = []
+    start = 0
+    count = 0
+    step = len(word_lower)
+    pos = text_lower.find(word_lower)
+    while pos != -1:
+        pieces.append(text[start:pos])
+        pieces.append(repl)
+        start = pos + step
+        count += 1
+        pos = text_lower.find(word_lower, start)
+    if not count:
+        return text, 0
+    pieces.append(text[start:])
+    return ''.join(pieces), count
+
+
+# RE2 与 re 语义不一致的写法：\d \w \s \b 等在 RE2 中仅匹配 ASCII，$ 不匹配末尾换行之前的位置。
+# 含这些写法的正则仍交给 re，保证两种引擎下结果相同
+_RE2_UNSAFE_RE = re.compile(r'\\[dDwWsSbB]|\$')
+
+
+class _Re2Pattern:
+    """RE2 正则的 re 兼容包装（仅提供敏感词处理用到的 search / subn）
+
+    google-re2 对含非 ASCII 字符的替换模板编码有误，普通替换文本改用可调用对象传入；
+    含反斜杠（分组引用、转义）的替换模板交给同一模式的 re 版本展开。
+    """
+
+    __slots__ = ('_regex', '_source', '_flags', '_fallback')
+
+    def __init__(self, regex, source: str, flags: int):
+        self._regex = regex
+        self._source = source
+        self._flags = flags
+        self._fallback = None
+
+    def search(self, text: str):
+        return self._regex.search(text)
+
+    def subn(self, repl: str, text: str) -> Tuple[str, int]:
+        if '\\' not in repl:
+            return self._regex.subn(lambda _m: repl, text)
+        if self._fallback is None:
+            self._fallback = re.compile(self._source, self._flags)
+        return self._fallback.subn(repl, text)
+
+
+def _compile_re2(source: str, case_sensitive: bool) -> Optional[_Re2Pattern]:
+    """用 RE2 编译正则（线性时间匹配，不会灾难性回溯）
+
+    未安装 google-re2、RE2 不支持该语法（反向引用、环视等）或语义与 re 不一致时返回 None，
+    由调用方回退到 re。
+    """
+    if re2 is None or _RE2_UNSAFE_RE.search(source):
+        return None
+    options = re2.Options()
+    options.case_sensitive = case_sensitive
+    options.log_errors = False
+    try:
+        regex = re2.compile(source, options)
+    except re2.error:
+        return None
+    return _Re2Pattern(regex, source, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _build_re2_set(sources: List[str], case_sensitive: bool):
+    """构建 RE2 多模式集合，一次扫描得出命中的模式下标；构建失败时返回 None"""
+    options = re2.Options()
+    options.case_sensitive = case_sensitive
+    options.log_errors = False
+    try:
+        pattern_set = re2.Set.SearchSet(options)
+        for source in sources:
+            pattern_set.Add(source)
+        pattern_set.Compile()
+    except re2.error:
+        return None
+    return pattern_set
+
+
+# 多进程清洗 JSONL：源文件不小于该大小时才启用（小文件启动子进程的开销大于收益）
+_PARALLEL_CLEAN_MIN_BYTES = 16 * 1024 * 1024
+# 每次分发给子进程的行数
+_PARALLEL_CLEAN_CHUNK_LINES = 5000
+
+
+def _new_chunk_stats() -> Dict[str, Any]:
+    """子进程内单个数据块的统计（仅含 _apply_operations 会累加的项）"""
+    return {
+        'total_rows': 0,
+        'removed_empty': 0,
+        'filtered_sensitive': 0,
+        'desensitized': 0,
+        'normalized': 0,
+        'sensitive_detail': {
+            'field_hits': {},
+            'word_hits': {},
+        }
+    }
+
+
+def _merge_clean_stats(stats: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    """把子进程返回的统计增量累加到任务统计"""
+    for key, value in delta.items():
+        if isinstance(value, dict):
+            target = stats[key]
+            for sub_key, counts in value.items():
+                merged = target[sub_key]
+                for name, count in counts.items():
+                    merged[name] = merged.get(name, 0) + count
+        else:
+            stats[key] = stats.get(key, 0) + value
+
+
+def _clean_jsonl_chunk(operations: List[str], params: Dict[str, Any],
+                       lines: List[Tuple[int, bytes]]) -> Tuple[List[Tuple[int, str, Any]], Dict[str, Any]]:
+    """子进程：解析并清洗一批 JSONL 行
+
+    Returns:
+        (results, stats): results 按输入顺序给出 (行号, 类型, 值)，类型为
+        'ok'（值为清洗结果，被过滤时为 None）、'invalid'（无效 JSON）或 'error'（处理出错），
+        后两者的值为错误信息；stats 为本批次的统计增量。
+    """
+    stats = _new_chunk_stats()
+    results: List[Tuple[int, str, Any]] = []
+    for line_num, line in lines:
+        try:
+            data = json_loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            results.append((line_num, 'invalid', str(e)))
+            continue
+        try:
+            stats['total_rows'] += 1
+            results.append((line_num, 'ok', data_cleaner._apply_operations(data, operations, params, stats)))
+        except Exception as e:
+            results.append((line_num, 'error', str(e)))
+    return results, stats
+
+
+# 文本标准化：全角->半角转换表（str.translate 在 C 层逐字符映射）
+_FULLWIDTH_TABLE = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+_FULLWIDTH_TABLE[0x3000] = 0x20
 
 
 class CleaningOperation:
@@ -108,6 +284,13 @@ class DataCleaner:
             '邮箱', 'email', '地址', 'address', '银行卡', 'bankcard'
         ]
         
+        # 敏感词正则缓存: (词表, 正则模式, 大小写敏感) -> (逐词模式列表, 合并预筛模式, RE2 多模式集合)
+        self._sensitive_pattern_cache: Dict[Tuple[Tuple[str, ...], bool, bool], Tuple[List[Any], Any, Any]] = {}
+        # PII 合并模式缓存: 启用类型（有序） -> 命名分组交替式
+        self._pii_pattern_cache: Dict[Tuple[str, ...], Any] = {}
+        # 最近一次整理的敏感词处理参数: (params 对象, 整理结果)，同一任务的所有记录复用
+        self._sensitive_options: Optional[Tuple[Dict[str, Any], Tuple[Any, ...]]] = None
+        
         self.logger.info('数据清洗器初始化完成')
     
     def start_clean(self, params: Dict[str, Any]) -> str:
@@ -246,14 +429,37 @@ class DataCleaner:
         # 生成元数据
         self._generate_metadata(task_id, params, cleaning_stats, str(output_file))
     
+    def _get_clean_workers(self, source_path: Path) -> int:
+        """清洗 JSONL 使用的进程数，返回 1 表示在当前进程内逐行处理
+
+        由 process.clean_workers 配置（0 为自动：不超过 base.max_workers 与 CPU 核数），
+        源文件小于 _PARALLEL_CLEAN_MIN_BYTES 时不启用多进程。
+        """
+        workers = int(config_manager.get_config('process.clean_workers', 0) or 0)
+        if workers <= 0:
+            workers = min(int(config_manager.get_config('base.max_workers', 4) or 1), os.cpu_count() or 1)
+        if workers <= 1:
+            return 1
+        try:
+            if source_path.stat().st_size < _PARALLEL_CLEAN_MIN_BYTES:
+                return 1
+        except OSError:
+            return 1
+        return workers
+
     def _clean_jsonl(self, source_path: Path, output_file: Path, operations: List[str],
                     params: Dict[str, Any], stats: Dict[str, int], task_id: str) -> None:
         """清洗JSONL文件"""
+        workers = self._get_clean_workers(source_path)
+        if workers > 1:
+            self._clean_jsonl_parallel(source_path, output_file, operations, params, stats, task_id, workers)
+            return
         seen_records = None  # remove_duplicates 已废弃
         dedup_field = params.get('dedup_field', '')
         dedup_cache = set() if CleaningOperation.DEDUPLICATE in operations else None
         
-        with open(source_path, 'r', encoding='utf-8') as infile, \
+        # 以二进制逐行读取，直接交给 json_loads（可用 orjson 时省去解码），内存占用与文件大小无关
+        with open(source_path, 'rb') as infile, \
              open(output_file, 'w', encoding='utf-8') as outfile:
             
             for line_num, line in enumerate(infile, 1):
@@ -264,7 +470,7 @@ class DataCleaner:
                         state_manager.update_state(task_id, 'progress', progress)
                         state_manager.update_state(task_id, 'processed_rows', line_num)
                     
-                    data = json.loads(line.strip())
+                    data = json_loads(line)
                     stats['total_rows'] += 1
                     
                     # 执行清洗操作
@@ -295,6 +501,66 @@ class DataCleaner:
                     continue
         
         stats['final_rows'] = stats['processed_rows']
+
+    def _clean_jsonl_parallel(self, source_path: Path, output_file: Path, operations: List[str],
+                              params: Dict[str, Any], stats: Dict[str, Any], task_id: str,
+                              workers: int) -> None:
+        """多进程清洗JSONL文件
+
+        按 _PARALLEL_CLEAN_CHUNK_LINES 行分块交给子进程解析和清洗，按提交顺序取回结果，
+        去重与写出仍在当前进程内按原始顺序进行，输出与单进程一致。
+        同时在途的数据块不超过进程数的两倍，内存占用与文件大小无关。
+        """
+        dedup_field = params.get('dedup_field', '')
+        dedup_cache = set() if CleaningOperation.DEDUPLICATE in operations else None
+        pending = deque()
+
+        def collect(future) -> None:
+            results, delta = future.result()
+            _merge_clean_stats(stats, delta)
+            for line_num, kind, value in results:
+                if kind == 'invalid':
+                    self.logger.warning(f'跳过无效JSON行 {line_num}: {value}')
+                    continue
+                if kind == 'error':
+                    self.logger.error(f'处理行 {line_num} 时出错: {value}')
+                    continue
+                if value is None:
+                    continue  # 被过滤掉的记录
+                if dedup_cache is not None and dedup_field and dedup_field in value:
+                    field_value = str(value[dedup_field])
+                    if self._is_duplicate(field_value, dedup_cache, self.dedup_threshold):
+                        stats['deduplicated'] += 1
+                        continue
+                    dedup_cache.add(field_value)
+                outfile.write(json.dumps(value, ensure_ascii=False) + '\n')
+                stats['processed_rows'] += 1
+            if results:
+                line_num = results[-1][0]
+                progress = min(line_num / stats.get('estimated_total', line_num) * 100, 100)
+                state_manager.update_state(task_id, 'progress', progress)
+                state_manager.update_state(task_id, 'processed_rows', line_num)
+
+        # 界面进程是多线程的，使用 spawn 启动子进程以避免 fork 带来的锁状态问题
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool, \
+             open(source_path, 'rb') as infile, \
+             open(output_file, 'w', encoding='utf-8') as outfile:
+            chunk: List[Tuple[int, bytes]] = []
+            for line_num, line in enumerate(infile, 1):
+                chunk.append((line_num, line))
+                if len(chunk) < _PARALLEL_CLEAN_CHUNK_LINES:
+                    continue
+                pending.append(pool.submit(_clean_jsonl_chunk, operations, params, chunk))
+                chunk = []
+                if len(pending) >= workers * 2:
+                    collect(pending.popleft())
+            if chunk:
+                pending.append(pool.submit(_clean_jsonl_chunk, operations, params, chunk))
+            while pending:
+                collect(pending.popleft())
+
+        stats['final_rows'] = stats['processed_rows']
     
     def _clean_csv(self, source_path: Path, output_file: Path, operations: List[str],
                   params: Dict[str, Any], stats: Dict[str, int], task_id: str) -> None:
@@ -472,25 +738,10 @@ class DataCleaner:
 
         # 敏感词
         if CleaningOperation.FILTER_SENSITIVE in operations:
-            sensitive_words = params.get('sensitive_words', self.default_sensitive_words)
-            action = params.get('sensitive_action', 'drop_record')
-            replacement = params.get('sensitive_replacement', '***')
-            allowed_fields = params.get('sensitive_fields')  # 白名单
-            exclude_fields = params.get('sensitive_exclude_fields')  # 黑名单
-            field_policy_map = params.get('sensitive_field_policies_parsed')  # 字段策略: field -> (action, replacement)
-            use_regex = bool(params.get('sensitive_use_regex'))
-            case_sensitive = bool(params.get('sensitive_case_sensitive'))
             hit, modified, dropped = self._process_sensitive(
                 result,
-                sensitive_words,
-                action,
-                replacement,
-                allowed_fields,
-                exclude_fields,
-                field_policy_map,
-                use_regex,
-                case_sensitive,
-                stats
+                *self._get_sensitive_options(params),
+                stats=stats
             )
             if hit:
                 if dropped:
@@ -534,14 +785,111 @@ class DataCleaner:
             return True
         return False
 
+    @staticmethod
+    def parse_field_policies(text: Optional[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+        """解析字段策略字符串，如 "instruction:replace_word:@@@,note:remove_word"
+
+        Returns:
+            字段 -> (动作, 替换文本)；未给出替换文本时为 None，替换文本中可以包含 ':'
+        """
+        mapping: Dict[str, Tuple[str, Optional[str]]] = {}
+        if not text:
+            return mapping
+        for seg in text.split(','):
+            # 最多切成三段，替换文本中的 ':' 原样保留在第三段
+            parts = seg.strip().split(':', 2)
+            if len(parts) < 2:
+                continue
+            field = parts[0].strip()
+            if not field:
+                continue
+            repl = parts[2].strip() if len(parts) == 3 else None
+            mapping[field] = (parts[1].strip(), repl)
+        return mapping
+
+    def _get_sensitive_options(self, params: Dict[str, Any]) -> Tuple[Any, ...]:
+        """整理敏感词处理参数，按 _process_sensitive 的参数顺序返回
+
+        同一清洗任务的 params 对象不变，只在首条记录时整理一次，后续记录直接复用。
+        """
+        cached = self._sensitive_options
+        if cached is not None and cached[0] is params:
+            return cached[1]
+        allowed_fields = params.get('sensitive_fields')  # 白名单
+        exclude_fields = params.get('sensitive_exclude_fields')  # 黑名单
+        options = (
+            tuple(params.get('sensitive_words', self.default_sensitive_words)),
+            params.get('sensitive_action', 'drop_record'),
+            params.get('sensitive_replacement', '***'),
+            frozenset(allowed_fields) if allowed_fields else None,
+            frozenset(exclude_fields) if exclude_fields else None,
+            params.get('sensitive_field_policies_parsed'),  # 字段策略: field -> (action, replacement)
+            bool(params.get('sensitive_use_regex')),
+            bool(params.get('sensitive_case_sensitive')),
+        )
+        self._sensitive_options = (params, options)
+        return options
+
+    def _get_sensitive_patterns(self, words: Tuple[str, ...], use_regex: bool,
+                                case_sensitive: bool) -> Tuple[List[Any], Any, Any]:
+        """获取编译好的敏感词模式（按词表与匹配选项缓存，跨记录、跨任务复用）
+
+        正则模式下若安装了 google-re2，语义一致的模式优先用 RE2 编译；
+        全部有效模式都由 RE2 编译时，另建 RE2 多模式集合做预扫描。
+
+        Returns:
+            (patterns, combined, pattern_set): patterns 与 words 一一对应，无效正则为 None；
+            combined 为所有有效模式的合并交替式，仅用于判断字段是否可能命中，
+            无法安全合并（含反向引用等）或已有 pattern_set 时为 None；
+            pattern_set 为 RE2 多模式集合，其下标与 words 一一对应，不可用时为 None。
+        """
+        key = (words, use_regex, case_sensitive)
+        cached = self._sensitive_pattern_cache.get(key)
+        if cached is not None:
+            return cached
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        patterns: List[Any] = []
+        sources: List[str] = []
+        all_re2 = use_regex and re2 is not None
+        for w in words:
+            source = w if use_regex else re.escape(w)
+            compiled = _compile_re2(source, case_sensitive) if use_regex else None
+            if compiled is None:
+                all_re2 = False
+                try:
+                    compiled = re.compile(source, flags)
+                except re.error:
+                    self.logger.warning(f'无效正则敏感词跳过: {w}')
+                    patterns.append(None)
+                    continue
+            patterns.append(compiled)
+            sources.append(source)
+
+        combined = None
+        # RE2 集合的下标需与 words 对应，仅在每个词都由 RE2 编译成功时构建
+        pattern_set = _build_re2_set(sources, case_sensitive) if all_re2 and sources else None
+        # 反向引用的分组编号在合并后会错位，此时不做合并预筛
+        if pattern_set is None and sources and not any(re.search(r'\\\d|\(\?P=', s) for s in sources):
+            try:
+                combined = re.compile('|'.join(f'(?:{s})' for s in sources), flags)
+            except re.error:
+                combined = None
+
+        if len(self._sensitive_pattern_cache) >= 64:
+            self._sensitive_pattern_cache.clear()
+        cached = (patterns, combined, pattern_set)
+        self._sensitive_pattern_cache[key] = cached
+        return cached
+
     def _process_sensitive(
         self,
         data: Dict[str, Any],
-        words: List[str],
+        words: Sequence[str],
         global_action: str,
         global_replacement: str,
-        allowed_fields: Optional[List[str]] = None,
-        exclude_fields: Optional[List[str]] = None,
+        allowed_fields: Optional[Collection[str]] = None,
+        exclude_fields: Optional[Collection[str]] = None,
         field_policy_map: Optional[Dict[str, Any]] = None,
         use_regex: bool = False,
         case_sensitive: bool = False,
@@ -554,27 +902,45 @@ class DataCleaner:
           - 字段级策略 (action, replacement)
           - 正则模式 / 大小写开关
           - 统计字段与词命中次数
+
+        默认配置（普通模式 + 忽略大小写）走快速路径：字段文本只做一次 lower()，
+        词条小写表按词表缓存，用 str.find 查找替换，不经过正则引擎；
+        大小写敏感的普通模式直接用 str.count / str.replace。
+        普通模式下若安装了 pyahocorasick，先用自动机一遍扫描得出字段中出现的词条，
+        未命中的字段直接跳过，命中字段也只处理出现过的词条；否则用缓存的合并正则预筛。
         """
         if not words:
             return (False, False, False)
-        # 预构建 regex 或普通匹配资源
-        flags = 0 if case_sensitive else re.IGNORECASE
-        compiled_patterns: List[Tuple[str, Any]] = []
-        if use_regex:
-            for w in words:
-                try:
-                    compiled_patterns.append((w, re.compile(w, flags)))
-                except re.error:
-                    self.logger.warning(f'无效正则敏感词跳过: {w}')
-        else:
-            # 普通词，转义后用于 re.sub
-            for w in words:
-                pattern = re.compile(re.escape(w), flags)
-                compiled_patterns.append((w, pattern))
+        words = tuple(words)
+        ci_literal = not use_regex and not case_sensitive
+        words_lower = _lower_words(words) if ci_literal else ()
+        automaton = None if use_regex else _word_automaton(words_lower if ci_literal else words)
+        compiled_patterns, combined_pattern, pattern_set = self._get_sensitive_patterns(words, use_regex, case_sensitive)
 
-        allowed_set = set(allowed_fields) if allowed_fields else None
-        exclude_set = set(exclude_fields) if exclude_fields else None
+        # 已整理为 frozenset 的字段集合（见 _get_sensitive_options）直接使用
+        if isinstance(allowed_fields, frozenset) or not allowed_fields:
+            allowed_set = allowed_fields or None
+        else:
+            allowed_set = set(allowed_fields)
+        if isinstance(exclude_fields, frozenset) or not exclude_fields:
+            exclude_set = exclude_fields or None
+        else:
+            exclude_set = set(exclude_fields)
         field_policy_map = field_policy_map or {}
+
+        # 记录级预筛：待检查字段拼接后只做一次自动机扫描，遇到首个命中即停止，整条无命中直接返回。
+        # 拼接处可能凑出跨字段的假命中，此时仅多走一遍逐字段检查，不影响结果
+        if automaton is not None:
+            record_text = '\n'.join(
+                v for f, v in data.items()
+                if isinstance(v, str)
+                and (allowed_set is None or f in allowed_set)
+                and (exclude_set is None or f not in exclude_set)
+            )
+            scan_text = record_text.lower() if ci_literal else record_text
+            # 小写后变长（如 'İ'）时逐字段路径会改用正则，预筛结果不再可靠，跳过预筛
+            if len(scan_text) == len(record_text) and next(automaton.iter(scan_text), None) is None:
+                return (False, False, False)
         field_hits = stats['sensitive_detail']['field_hits'] if stats else None
         word_hits = stats['sensitive_detail']['word_hits'] if stats else None
 
@@ -603,39 +969,71 @@ class DataCleaner:
 
             original = value
             new_val = value
+            # remove_word 删除词本身；replace_word 及未知动作使用 replacement
+            rep_text = '' if action == 'remove_word' else replacement
+            lowered = new_val.lower() if ci_literal else None
+
+            # 多模式预扫描：得到原文中出现的词条下标集合
+            present = None
+            if automaton is not None and (lowered is None or len(lowered) == len(new_val)):
+                present = set()
+                for _, indices in automaton.iter(new_val if lowered is None else lowered):
+                    present.update(indices)
+                if not present:
+                    continue
+            elif pattern_set is not None:
+                present = set(pattern_set.Match(new_val) or ())
+                if not present:
+                    continue
+            elif combined_pattern is not None and not combined_pattern.search(new_val):
+                continue
+            changed = False
 
-            for raw_pat, comp_pat in compiled_patterns:
-                # 快速包含检查（普通模式时可以先做）
-                if not use_regex and (case_sensitive and raw_pat not in new_val) and (not case_sensitive and raw_pat.lower() not in new_val.lower()):
+            for idx, raw_pat in enumerate(words):
+                # 文本被替换前，预扫描结果精确有效；替换后可能拼接出新词，回到逐词检查
+                if present is not None and not changed and idx not in present:
                     continue
+                # 小写后长度不变时才能按位置对应原文（极少数字符如 'İ' 会变长）
+                if lowered is not None and len(lowered) == len(new_val):
+                    word_lower = words_lower[idx]
+                    if word_lower not in lowered:
+                        continue
+                    if action == 'drop_record':
+                        count = 1
+                    else:
+                        new_val, count = _replace_literal_ci(new_val, lowered, word_lower, rep_text)
+                        lowered = new_val.lower()
+                elif not use_regex and case_sensitive:
+                    # 大小写敏感的普通词：C 层子串查找/替换，语义与 re.escape + subn 一致
+                    if raw_pat not in new_val:
+                        continue
+                    if action == 'drop_record':
+                        count = 1
+                    else:
+                        count = new_val.count(raw_pat)
+                        new_val = new_val.replace(raw_pat, rep_text)
+                else:
+                    comp_pat = compiled_patterns[idx]
+                    if comp_pat is None:
+                        continue
+                    if action == 'drop_record':
+                        count = 1 if comp_pat.search(new_val) else 0
+                    else:
+                        new_val, count = comp_pat.subn(rep_text, new_val)
+                        if count and lowered is not None:
+                            lowered = new_val.lower()
+                if not count:
+                    continue
+                if field_hits is not None:
+                    field_hits[field] = field_hits.get(field, 0) + count
+                if word_hits is not None:
+                    word_hits[raw_pat] = word_hits.get(raw_pat, 0) + count
                 if action == 'drop_record':
                     # 只要任一命中即可丢弃整条
-                    if comp_pat.search(new_val):
-                        if field_hits is not None:
-                            field_hits[field] = field_hits.get(field, 0) + 1
-                        if word_hits is not None:
-                            word_hits[raw_pat] = word_hits.get(raw_pat, 0) + 1
-                        return (True, False, True)
-                elif action in ('remove_word', 'replace_word'):
-                    rep_text = '' if action == 'remove_word' else replacement
-                    new_val, count = comp_pat.subn(rep_text, new_val)
-                    if count:
-                        hit_any = True
-                        modified_any = True
-                        if field_hits is not None:
-                            field_hits[field] = field_hits.get(field, 0) + count
-                        if word_hits is not None:
-                            word_hits[raw_pat] = word_hits.get(raw_pat, 0) + count
-                else:
-                    # 未知动作: 视为 replace_word 使用全局 replacement
-                    new_val, count = comp_pat.subn(replacement, new_val)
-                    if count:
-                        hit_any = True
-                        modified_any = True
-                        if field_hits is not None:
-                            field_hits[field] = field_hits.get(field, 0) + count
-                        if word_hits is not None:
-                            word_hits[raw_pat] = word_hits.get(raw_pat, 0) + count
+                    return (True, False, True)
+                hit_any = True
+                modified_any = True
+                changed = True
 
             if new_val != original:
                 data[field] = new_val
@@ -653,62 +1051,74 @@ class DataCleaner:
         'ip': re.compile(r'\b(?:(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d?\d)\b'),
         'passport': re.compile(r'\b(?:[EePpKkSsGgDd]\d{8})\b')
     }
+    # 以上每类 PII 都至少包含一个数字或 '@'，不含二者的字段无需进入合并模式扫描
+    _PII_HINT = re.compile(r'[\d@]')
+
+    def _get_pii_pattern(self, active: Tuple[str, ...]):
+        """获取启用类型的合并 PII 模式 (?P<类型>...)|...，仅用于判断字段是否含任一类 PII"""
+        combined = self._pii_pattern_cache.get(active)
+        if combined is None:
+            combined = re.compile('|'.join(
+                f'(?P<{cat}>{self._PII_PATTERNS[cat].pattern})' for cat in active
+            ))
+            self._pii_pattern_cache[active] = combined
+        return combined
 
     def _pii_desensitize(self, data: Dict[str, Any], categories: List[str], repl_map: Dict[str, str]) -> bool:
+        """PII 脱敏：合并模式一次扫描筛掉不含 PII 的字段，命中的字段再按类型顺序逐类替换
+
+        逐类替换与合并模式一次替换在相邻片段上结果不同（如 '13812345678.a@b.com'：
+        先替换手机号得到 '<phone>.<EMAIL>@b.com'，合并模式则整段按邮箱替换、丢掉 '.'），
+        因此替换仍按启用顺序逐类进行，合并模式只做预筛。
+        """
         modified = False
-        active = [c for c in categories if c in self._PII_PATTERNS]
+        # 去重并保持顺序（命名分组不可重复）
+        active = tuple(dict.fromkeys(c for c in categories if c in self._PII_PATTERNS))
         if not active:
             return False
+        combined = self._get_pii_pattern(active)
+        replacements = []
+        for cat in active:
+            rep = repl_map.get(cat) or repl_map.get('default') or f'<{cat}>'
+            if cat == 'email':
+                # 仅替换本地部分，保留域名
+                prefix = (rep if rep != '<email>' else '<EMAIL>') + '@'
+                rep = lambda m, prefix=prefix: prefix + m.group(0).split('@', 1)[1]
+            replacements.append((self._PII_PATTERNS[cat], rep))
+
         for field, value in data.items():
-            if not isinstance(value, str):
+            # 任一类型在原文中有匹配，合并模式必能在同一位置或更早处匹配，未命中的字段无需逐类扫描
+            if not isinstance(value, str) or not self._PII_HINT.search(value) or not combined.search(value):
                 continue
             new_val = value
-            for cat in active:
-                patt = self._PII_PATTERNS[cat]
-                rep_default = repl_map.get(cat) or repl_map.get('default') or f'<{cat}>'
-                if cat == 'email':
-                    # 仅替换本地部分，保留域名
-                    def _sub_email(m):
-                        full = m.group(0)
-                        local, domain = full.split('@', 1)
-                        return (rep_default if rep_default != f'<{cat}>' else '<EMAIL>') + '@' + domain
-                    new_val, count = patt.subn(_sub_email, new_val)
-                else:
-                    new_val, count = patt.subn(rep_default, new_val)
-                if count:
-                    modified = True
+            for patt, rep in replacements:
+                new_val = patt.sub(rep, new_val)
             if new_val != value:
+                modified = True
                 data[field] = new_val
         return modified
 
     def _normalize_text(self, data: Dict[str, Any], modes: List[str]) -> bool:
-        import unicodedata
         modes = set(modes or [])
         modified = False
-        def fullwidth_to_halfwidth(s: str) -> str:
-            res = []
-            for ch in s:
-                code = ord(ch)
-                if 0xFF01 <= code <= 0xFF5E:
-                    res.append(chr(code - 0xFEE0))
-                elif code == 0x3000:
-                    res.append(' ')
-                else:
-                    res.append(ch)
-            return ''.join(res)
+        nfc = 'unicode_nfc' in modes
+        fullwidth = 'fullwidth' in modes
+        lowercase = 'lowercase' in modes
+        # unicodedata.is_normalized 为 3.8+ 的快速检查，已是 NFC 的文本无需重建
+        is_normalized = getattr(unicodedata, 'is_normalized', None)
         for field, value in data.items():
             if not isinstance(value, str):
                 continue
             orig = value
-            text = value.strip()
-            text = re.sub(r'\s+', ' ', text)
-            if 'collapse_newlines' in modes:
-                text = re.sub(r'(\n\s*){2,}', '\n', text)
-            if 'unicode_nfc' in modes:
-                text = unicodedata.normalize('NFC', text)
-            if 'fullwidth' in modes:
-                text = fullwidth_to_halfwidth(text)
-            if 'lowercase' in modes:
+            # 去首尾空白 + 连续空白折叠为单个空格，一次 split/join 完成（与 \s+ 的空白定义一致）。
+            # 换行也在此折叠，因此 collapse_newlines 模式无需再单独处理
+            text = ' '.join(value.split())
+            if nfc and not text.isascii():
+                if is_normalized is None or not is_normalized('NFC', text):
+                    text = unicodedata.normalize('NFC', text)
+            if fullwidth and not text.isascii():
+                text = text.translate(_FULLWIDTH_TABLE)
+            if lowercase:
                 text = text.lower()
             if text != orig:
                 data[field] = text
@@ -30,6 +30,7 @@ import uuid
 from typing import Dict, List, Union, Optional, TypedDict, Literal, Any, Tuple
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 添加项目根目录到Python路径
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -92,6 +93,9 @@ except ImportError:
             except Exception:
                 return False
 
+# 合并前扫描输入文件（统计行数）的最大并行线程数
+MERGE_IO_WORKERS = 16
+
 # 类型定义
 class MergeTaskParams(TypedDict):
     """数据合并任务参数结构"""
@@ -759,10 +763,10 @@ class DataMerger:
         else:
             base_fields = self._get_fields_simple(first_file, file_format)
         
-        # 计算总行数
-        total_rows = 0
-        for file_path in input_paths:
-            total_rows += self._count_file_rows(file_path, file_format)
+        # 计算总行数：各文件互不依赖且以磁盘读取为主，用线程池并行统计
+        workers = max(1, min(MERGE_IO_WORKERS, len(input_paths)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="merge-count") as pool:
+            total_rows = sum(pool.map(lambda path: self._count_file_rows(path, file_format), input_paths))
         
         return base_fields, file_format, total_rows
     
@@ -291,6 +291,18 @@ class Logger:
         self.logger.debug(msg)
 
 
+# 任务变更代数：增删任务或任务状态切换时递增，界面在没有进行中任务时据此跳过刷新
+_task_generation = 0
+_task_generation_lock = threading.Lock()
+
+
+def _bump_task_generation():
+    """递增任务变更代数"""
+    global _task_generation
+    with _task_generation_lock:
+        _task_generation += 1
+
+
 class ProgressTracker:
     """
     进度跟踪器
@@ -338,6 +350,7 @@ class ProgressTracker:
             # 使用datetime记录开始时间，last_update仍然用时间戳用于速度计算
             self.start_time = datetime.now()
             self.last_update = time.time()
+        _bump_task_generation()
     
     def update(self, downloaded_bytes: int):
         """
@@ -388,6 +401,7 @@ class ProgressTracker:
         with self.lock:
             self.status = "completed"
             self.progress = 100
+        _bump_task_generation()
     
     def fail(self, error_msg: str = ""):
         """
@@ -399,18 +413,21 @@ class ProgressTracker:
         with self.lock:
             self.status = "failed"
             self.error_msg = error_msg
+        _bump_task_generation()
     
     def pause(self):
         """暂停任务"""
         with self.lock:
             if self.status == "running":
                 self.status = "paused"
+        _bump_task_generation()
     
     def resume(self):
         """恢复任务"""
         with self.lock:
             if self.status == "paused":
                 self.status = "running"
+        _bump_task_generation()
     
     def get_info(self) -> Dict[str, Any]:
         """
@@ -728,9 +745,9 @@ class DatasetDownloader:
         """保存任务到状态文件"""
         try:
             if USE_EXTERNAL_MODULES and hasattr(self, 'state_mgr'):
-                # 序列化任务数据
+                # 序列化任务数据（遍历快照，避免其他线程同时增删任务时迭代出错）
                 serializable_tasks = {}
-                for task_id, task_data in self.tasks.items():
+                for task_id, task_data in list(self.tasks.items()):
                     serializable_task = {
                         'params': task_data['params']
                     }
@@ -804,6 +821,7 @@ class DatasetDownloader:
             'params': task_params,
             'tracker': tracker
         }
+        _bump_task_generation()
         
         # 保存任务状态到文件
         self._save_tasks_to_state()
@@ -2278,6 +2296,17 @@ class DatasetDownloader:
         except Exception:
             return ""
     
+    def get_task_generation(self) -> int:
+        """
+        获取任务变更代数
+        
+        任务增删或任务状态切换时递增；下载中的进度变化不计入，需轮询 list_tasks 获取。
+        
+        Returns:
+            当前变更代数
+        """
+        return _task_generation
+    
     def get_task_progress(self, task_id: str) -> Dict[str, Any]:
         """
         获取指定任务的进度信息
@@ -2355,7 +2384,8 @@ class DatasetDownloader:
             包含所有任务信息的列表
         """
         result = []
-        for task_id, task in self.tasks.items():
+        # 遍历快照，避免其他线程同时增删任务时迭代出错
+        for task_id, task in list(self.tasks.items()):
             # 使用get_task_progress获取实时进度，而不是直接调用tracker.get_info()
             progress_info = self.get_task_progress(task_id)
             
@@ -2452,6 +2482,7 @@ class DatasetDownloader:
                 self.logger.error(f"删除文件失败: {str(e)}", task_id)
         
         del self.tasks[task_id]
+        _bump_task_generation()
         
         # 保存任务状态到文件
         self._save_tasks_to_state()
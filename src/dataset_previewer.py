@@ -13,6 +13,7 @@
 import json
 import csv
 from .dependencies import pd, datasets
+from .utils import json_loads
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
@@ -526,24 +527,26 @@ class DatasetPreviewer:
         skip_count = file_size > 100 * 1024 * 1024  # 100MB
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                for line_num, line in enumerate(f):
+            # 按二进制行读取：只有需要加载的行才解码，剩余行只做计数
+            with open(file_path, 'rb') as f:
+                for line_num, raw in enumerate(f):
                     # 检查是否包含 NULL 字符，如果是则跳过（可能是损坏的数据）
-                    if '\x00' in line:
+                    if b'\x00' in raw:
                         continue
-                        
-                    if skip_count and len(data) >= max_rows:
-                        total_rows = -1 # 表示未知/未计算
-                        break
                     
-                    total_rows += 1
                     if len(data) >= max_rows:
-                        continue  # 继续计数但不加载数据
+                        if skip_count:
+                            total_rows = -1 # 表示未知/未计算
+                        else:
+                            # 已加载足够的预览行，剩余部分只计数不解码
+                            total_rows += 1 + sum(1 for rest in f if b'\x00' not in rest)
+                        break
                     
-                    line = line.strip()
+                    total_rows += 1
+                    line = raw.decode('utf-8', errors='replace').strip()
                     if line:
                         try:
-                            item = json.loads(line)
+                            item = json_loads(line)
                             data.append(item)
                         except json.JSONDecodeError as e:
                             # 仅在未达到最大行数时记录警告，避免日志爆炸
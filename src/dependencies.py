@@ -34,6 +34,9 @@ modelscope, HAS_MODELSCOPE = safe_import('modelscope')
 pq, HAS_PARQUET = safe_import('pyarrow.parquet')
 pa, HAS_PYARROW = safe_import('pyarrow')
 ET, HAS_XML = safe_import('xml.etree.ElementTree')
+ahocorasick, HAS_AHOCORASICK = safe_import('ahocorasick')
+re2, HAS_RE2 = safe_import('re2')
+orjson, HAS_ORJSON = safe_import('orjson')
 
 # Addict is used by modelscope
 addict, HAS_ADDICT = safe_import('addict')
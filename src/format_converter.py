@@ -37,7 +37,7 @@ import random
 import string
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, TypedDict, Iterable, Iterator
+from typing import Dict, Any, Optional, List, Union, TypedDict, Iterable, Iterator, Callable
 from concurrent.futures import ThreadPoolExecutor
 
 # 统一依赖管理导入
@@ -306,14 +306,16 @@ class ProgressTracker:
     - failed: 转换失败
     """
     
-    def __init__(self, task_id: str):
+    def __init__(self, task_id: str, on_change: Optional[Callable[[str], None]] = None):
         """
         初始化进度跟踪器
         
         Args:
             task_id: 任务唯一标识符
+            on_change: 状态/进度变化时的回调（参数为任务ID），在锁外调用
         """
         self.task_id = task_id
+        self.on_change = on_change
         self.status = "pending"
         self.progress = 0
         self.processed_rows = 0
@@ -327,6 +329,15 @@ class ProgressTracker:
         self.output_file = ""  # 添加输出文件路径记录
         self.lock = threading.Lock()
     
+    def notify(self):
+        """通知订阅方任务状态已变化（回调异常不影响转换流程）"""
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(self.task_id)
+        except Exception:
+            pass
+    
     def start(self, total_rows: int = 0):
         """开始进度跟踪"""
         with self.lock:
@@ -335,10 +346,12 @@ class ProgressTracker:
             self.start_time = time.time()
             self.last_update = self.start_time
             self.last_processed_rows = 0  # 重置上次处理行数
+        self.notify()
     
     def update(self, processed_rows: int):
         """更新处理进度"""
         with self.lock:
+            previous_progress = self.progress
             # 保存上一次的处理行数，用于计算速度
             previous_rows = self.processed_rows
             self.processed_rows = processed_rows
@@ -368,6 +381,10 @@ class ProgressTracker:
                         self.eta = remaining_rows / self.speed
             
             self.last_update = current_time
+        
+        # 仅在百分比变化时通知，避免逐行触发
+        if self.progress != previous_progress:
+            self.notify()
     
     def complete(self, output_file: str = ""):
         """标记任务完成"""
@@ -376,12 +393,14 @@ class ProgressTracker:
             self.progress = 100
             if output_file:
                 self.output_file = output_file
+        self.notify()
     
     def fail(self, error_msg: str = ""):
         """标记任务失败"""
         with self.lock:
             self.status = "failed"
             self.error_msg = error_msg
+        self.notify()
     
     def get_info(self) -> Dict[str, Any]:
         """获取进度信息"""
@@ -419,6 +438,10 @@ class FormatConverter:
         self.logger = Logger("format_converter")
         self.config.ensure_directories()
         self.tasks = {}  # 任务存储字典
+        self._on_change: Optional[Callable[[str], None]] = None  # 任务变化回调
+        # 任务变更代数：每次任务新增或状态/进度变化时递增，界面据此判断任务列表是否需要重建
+        self._task_generation = 0
+        self._generation_lock = threading.Lock()
         
         # 支持的格式列表
         self.supported_formats = ['csv', 'json', 'jsonl', 'excel', 'markdown', 'arrow']
@@ -429,6 +452,30 @@ class FormatConverter:
             'max_cols': self.config.get_config('process.excel_max_cols')
         }
     
+    def set_on_change(self, callback: Optional[Callable[[str], None]]):
+        """
+        注册任务变化回调
+        
+        任务新增、状态切换或进度百分比变化时调用 callback(task_id)，
+        调用发生在转换线程中，回调应尽快返回。传入 None 取消注册。
+        
+        Args:
+            callback: 变化回调函数
+        """
+        self._on_change = callback
+    
+    def get_task_generation(self) -> int:
+        """获取当前任务变更代数"""
+        return self._task_generation
+    
+    def _emit_change(self, task_id: str):
+        """递增任务变更代数，并转发跟踪器变化到已注册的回调"""
+        with self._generation_lock:
+            self._task_generation += 1
+        callback = self._on_change
+        if callback is not None:
+            callback(task_id)
+    
     def generate_task_id(self) -> str:
         """
         生成唯一的任务标识符
@@ -504,11 +551,12 @@ class FormatConverter:
         )
         
         # 创建进度跟踪器
-        tracker = ProgressTracker(task_id)
+        tracker = ProgressTracker(task_id, on_change=self._emit_change)
         self.tasks[task_id] = {
             'params': task_params,
             'tracker': tracker
         }
+        tracker.notify()
         
         self.logger.info(f"转换任务已创建: {source_path} -> {target_format}", task_id)
         return task_id
@@ -812,6 +860,7 @@ class FormatConverter:
                                     tracker.processed_rows = i + 1
                                     tracker.last_update = current_time
                                     last_update_time = current_time
+                                    tracker.notify()
                                 except:
                                     pass
                                     
@@ -870,6 +919,7 @@ class FormatConverter:
                             tracker.processed_rows = line_num
                             tracker.last_update = current_time
                             last_update_time = current_time
+                            tracker.notify()
                         except:
                             pass
                             
@@ -1332,17 +1382,34 @@ class FormatConverter:
         
         return self.tasks[task_id]['tracker'].get_info()
     
+    def _get_task_info(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """合并任务的进度信息与源文件、目标格式"""
+        info = task['tracker'].get_info()
+        info.update({
+            'source_path': task['params']['source_path'],
+            'target_format': task['params']['target_format']
+        })
+        return info
+    
     def list_tasks(self) -> List[Dict[str, Any]]:
         """列出所有任务"""
-        tasks_info = []
-        for task_id, task in self.tasks.items():
-            info = task['tracker'].get_info()
-            info.update({
-                'source_path': task['params']['source_path'],
-                'target_format': task['params']['target_format']
-            })
-            tasks_info.append(info)
-        return tasks_info
+        return [self._get_task_info(task) for task in self.tasks.values()]
+    
+    def find_task(self, task_id_prefix: str) -> Optional[Dict[str, Any]]:
+        """
+        按任务ID或ID前缀（如界面列表中被截断的ID）查找任务
+        
+        精确匹配直接按字典查找；否则按创建顺序返回第一个前缀匹配的任务。
+        只为命中的任务生成信息，不遍历全部任务的进度。
+        
+        Returns:
+            与 list_tasks() 中条目相同的任务信息，未找到时返回 None
+        """
+        task = self.tasks.get(task_id_prefix)
+        if task is None:
+            task_id = next((tid for tid in list(self.tasks) if tid.startswith(task_id_prefix)), None)
+            task = self.tasks.get(task_id) if task_id is not None else None
+        return self._get_task_info(task) if task is not None else None
 
 
 # 全局转换器实例
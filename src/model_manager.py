@@ -23,6 +23,7 @@
 
 import json
 import time
+import threading
 from .dependencies import requests
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
@@ -102,6 +103,9 @@ class ModelManager:
         self.default_timeout = config_manager.get_config('model.default_timeout', 600)
         self.test_prompt = config_manager.get_config('model.test_prompt', '测试连接')
         
+        # 连接测试可能并发执行，状态写回（修改配置并落盘）需串行
+        self._status_lock = threading.Lock()
+        
         # 初始化模型配置
         self._init_models_config()
         
@@ -558,13 +562,14 @@ class ModelManager:
     def _update_model_status(self, model_name: str, test_result: Dict[str, Any]) -> None:
         """更新模型状态"""
         try:
-            models = config_manager.get_config(self.config_key, {})
-            if model_name in models:
-                models[model_name]['status'] = test_result['status']
-                models[model_name]['last_test_time'] = datetime.now().isoformat()
-                models[model_name]['response_time'] = test_result.get('response_time', 0)
-                models[model_name]['error_msg'] = test_result.get('error_msg', '')
-                config_manager.update_config(self.config_key, models)
+            with self._status_lock:
+                models = config_manager.get_config(self.config_key, {})
+                if model_name in models:
+                    models[model_name]['status'] = test_result['status']
+                    models[model_name]['last_test_time'] = datetime.now().isoformat()
+                    models[model_name]['response_time'] = test_result.get('response_time', 0)
+                    models[model_name]['error_msg'] = test_result.get('error_msg', '')
+                    config_manager.update_config(self.config_key, models)
         except Exception as e:
             self.logger.error(f'更新模型状态失败: {e}')
     
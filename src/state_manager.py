@@ -24,6 +24,7 @@
 import json
 import os
 import threading
+import multiprocessing
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -108,8 +109,15 @@ class StateManager:
         
         # 线程安全锁
         self._lock = threading.RLock()
+        # 状态变更代数：每次修改任务或自定义状态时递增，界面据此跳过无变化的刷新
+        self._generation = 0
         self._auto_save_thread = None
         self._stop_auto_save = threading.Event()
+        # 多进程工作子进程（如并行清洗的 spawn 进程）导入模块时也会创建全局实例，
+        # 子进程不持有任务状态：不加载、不自动保存、不写状态文件，避免用过期快照覆盖主进程的状态
+        self._detached = multiprocessing.parent_process() is not None
+        if self._detached:
+            return
         
         # 加载现有状态
         self.load_state()
@@ -135,6 +143,20 @@ class StateManager:
         else:
             print(f"状态文件已存在: {self.state_file}")
     
+    def _mark_changed(self):
+        """记录状态已修改：更新最后修改时间并递增变更代数（调用方需持有锁）"""
+        self.state_data["last_updated"] = datetime.now().isoformat()
+        self._generation += 1
+    
+    def get_generation(self) -> int:
+        """
+        获取状态变更代数
+        
+        Returns:
+            int: 每次状态修改后递增的计数，值不变说明任务状态未变化
+        """
+        return self._generation
+    
     def add_task(self, task_type: Union[str, TaskType], task_subtype: str, 
                 params: Dict[str, Any], task_id: str = None) -> str:
         """
@@ -188,7 +210,7 @@ class StateManager:
             
             # 保存任务状态
             self.state_data["tasks"][task_id] = task_state
-            self.state_data["last_updated"] = datetime.now().isoformat()
+            self._mark_changed()
             
             return task_id
     
@@ -251,7 +273,7 @@ class StateManager:
             
             # 更新最后修改时间
             task_state["last_updated"] = datetime.now().isoformat()
-            self.state_data["last_updated"] = datetime.now().isoformat()
+            self._mark_changed()
             
             return True
     
@@ -350,7 +372,7 @@ class StateManager:
             if current_status in [TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, 
                                 TaskStatus.CANCELLED.value, TaskStatus.PAUSED.value]:
                 del self.state_data["tasks"][task_id]
-                self.state_data["last_updated"] = datetime.now().isoformat()
+                self._mark_changed()
                 # 立即保存状态，防止程序意外退出导致状态不一致
                 self.save_state()
                 return True
@@ -423,8 +445,10 @@ class StateManager:
         保存状态到文件
         
         Returns:
-            bool: 保存成功与否
+            bool: 保存成功与否（子进程中不写文件，返回 False）
         """
+        if self._detached:
+            return False
         try:
             with self._lock:
                 # 确保状态文件目录存在
@@ -470,6 +494,7 @@ class StateManager:
                 # 验证数据格式
                 if "tasks" in loaded_data:
                     self.state_data = loaded_data
+                    self._generation += 1
                     
                     # 修复可能的状态不一致
                     self._fix_inconsistent_states()
@@ -505,7 +530,7 @@ class StateManager:
         """设置状态字典中的自定义键值，并立即保存。"""
         with self._lock:
             self.state_data[key] = copy.deepcopy(value)
-            self.state_data["last_updated"] = datetime.now().isoformat()
+            self._mark_changed()
         # 立即持久化
         self.save_state()
     
@@ -640,7 +665,7 @@ class StateManager:
                 removed_count += 1
             
             if removed_count > 0:
-                self.state_data["last_updated"] = datetime.now().isoformat()
+                self._mark_changed()
                 self.save_state()
             
             return {
@@ -11,6 +11,34 @@ from ..distill_generator import distill_generator
 from ..state_manager import state_manager, TaskType
 import shutil
 
+
+# 各模型类型对应的 max_tokens 上限与提示（类型为大写）
+MAX_TOKENS_BOUNDS = {
+    'OPENAI': (8192, "最大Token数（OPENAI 兼容：建议<=8192，超出可能报错）"),
+    'VLLM': (200000, "最大Token数（本地/兼容后端：已放宽至 200000，请按模型上下文限制合理设置）"),
+    'OLLAMA': (200000, "最大Token数（本地/兼容后端：已放宽至 200000，请按模型上下文限制合理设置）"),
+    'SGLANG': (200000, "最大Token数（本地/兼容后端：已放宽至 200000，请按模型上下文限制合理设置）"),
+}
+DEFAULT_MAX_TOKENS_BOUND = (4000, "最大Token数（未知后端：保持默认上限 4000）")
+
+# 任务列表中的状态与策略中文名
+DISTILL_STATUS_LABELS = {
+    'pending': '等待中',
+    'running': '生成中',
+    'paused': '已暂停',
+    'completed': '已完成',
+    'failed': '失败'
+}
+DISTILL_STRATEGY_LABELS = {
+    'expand': '数据扩充',
+    'enhance': '内容增强',
+    'paraphrase': '文本改写',
+    'classify_label': '分类标注',
+    'q_to_a': '从Q生A',
+    'custom': '自定义'
+}
+
+
 class DistillTabManager:
     def __init__(self, launcher):
         self.launcher = launcher
@@ -292,8 +320,8 @@ class DistillTabManager:
                 show_copy_button=True
             )
         
-        # 自动刷新定时器
-        auto_refresh_timer = gr.Timer(value=2)
+        # 自动刷新定时器（仅在本标签页选中时由 UILauncher 开启）
+        auto_refresh_timer = gr.Timer(value=2, active=False)
         
         # 使用 State 存储选中的任务ID，避免 Dataframe 输入问题
         # 使用 list 存储以便 Gradio 在 JSON 序列化时保持稳定
@@ -302,37 +330,23 @@ class DistillTabManager:
 
 
         # 统一的 Dataframe 选择事件处理
-        def _on_task_list_select(evt: gr.SelectData, df_value, current_selection):
-            # 1. 准备基础数据
-            selection_set = set(current_selection or [])
-            df_copy = df_value.copy(deep=True) if isinstance(df_value, pd.DataFrame) else pd.DataFrame()
+        def _on_task_list_select(evt: gr.SelectData):
+            # 选择状态与表格数据均不变（复选框由 change 事件处理），跳过两个 State 的回写
+            no_state_update = [gr.skip(), gr.skip()]
             
             # 默认的表单更新（不改变任何值）
             no_form_update = [gr.update()] * 30
             
             try:
-                col_index = evt.index[1]
-                
-                # === 情况 A: 点击复选框列 (Column 0) ===
-                # 这里不再处理状态更新，全权交给 change 事件处理
-                # 仅保留日志以便调试
-                if col_index == 0:
-                    # self.logger.info(f"DEBUG: Cell select on checkbox column. Row={evt.index[0]}")
-                    return [list(selection_set), df_copy] + no_form_update
-
-                # === 情况 B: 点击任务ID列 (Column 1) ===
-                elif col_index == 1:
-                    # 调用原有的参数回填逻辑
+                # 点击任务ID列 (Column 1) 时调用原有的参数回填逻辑，其他列不做处理
+                if evt.index[1] == 1:
                     form_updates = self._select_distill_task(evt)
-                    return [list(selection_set), df_copy] + list(form_updates)
-
-                # === 情况 C: 点击其他列 ===
-                else:
-                    return [list(selection_set), df_copy] + no_form_update
+                    return no_state_update + list(form_updates)
+                return no_state_update + no_form_update
 
             except Exception as e:
                 self.logger.error(f"Selection error: {e}")
-                return [list(selection_set), df_copy] + no_form_update
+                return no_state_update + no_form_update
 
         # 新增：监听表格数据变化（捕获复选框点击）
         def _on_task_list_change(df):
@@ -364,7 +378,6 @@ class DistillTabManager:
         # 绑定 select 事件：处理点击任务ID的回填
         distill_task_list.select(
             fn=_on_task_list_select,
-            inputs=[current_df_state, selected_tasks_state],
             outputs=[
                 selected_tasks_state, 
                 current_df_state,
@@ -391,10 +404,21 @@ class DistillTabManager:
             self.logger.debug(f"[DistillTab] timer-refresh-output checkbox_true={true_count} rows={len(new_df)}")
             return new_df, df_state
 
+        # 本会话最近一次定时推送的 (状态变更代数, 选中ID)，未变化时跳过整表重建与下发
+        render_key_state = gr.State(value=None)
+
+        def _auto_refresh_with_state(selected_ids, last_key):
+            key = (state_manager.get_generation(), tuple(str(x) for x in (selected_ids or [])))
+            if key == last_key:
+                return gr.skip(), gr.skip(), gr.skip()
+            new_df, df_state = _refresh_with_state(selected_ids)
+            return new_df, df_state, key
+
         auto_refresh_timer.tick(
-            fn=_refresh_with_state,
-            inputs=[selected_tasks_state],
-            outputs=[distill_task_list, current_df_state]
+            fn=_auto_refresh_with_state,
+            inputs=[selected_tasks_state, render_key_state],
+            outputs=[distill_task_list, current_df_state, render_key_state],
+            show_progress="hidden"
         )
         
         # 存储组件引用
@@ -456,7 +480,9 @@ class DistillTabManager:
         )
         
         pause_distill_btn.click(
-            fn=self._pause_distill_generation,
+            fn=lambda task_id, selected_ids: self._pause_multiple_tasks(
+                None, selected_ids, [task_id.strip()] if task_id and task_id.strip() else []
+            ),
             inputs=[selected_distill_task, selected_tasks_state],
             outputs=[distill_status, distill_task_list, current_df_state]
         )
@@ -464,7 +490,9 @@ class DistillTabManager:
         refresh_distill_btn.click(
             fn=_refresh_with_state,
             inputs=[selected_tasks_state],
-            outputs=[distill_task_list, current_df_state]
+            outputs=[distill_task_list, current_df_state],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         view_report_btn.click(
@@ -517,11 +545,12 @@ class DistillTabManager:
             outputs=[strategy_desc, distill_count, q_prompt_box, a_prompt_box, label_set_input, dataset_fields_box, dataset_single_field_dropdown, selected_fields_input, source_field_input, target_field_input, q_field_name_input]
         )
 
-        # 模型变化事件（动态调整 max_tokens 上限）
+        # 模型变化事件（动态调整 max_tokens 上限），上限与提示不变时不重复下发
+        max_tokens_bound_state = gr.State(value=None)
         distill_model.change(
             fn=self._on_distill_model_change,
-            inputs=[distill_model],
-            outputs=[distill_max_tokens]
+            inputs=[distill_model, max_tokens_bound_state],
+            outputs=[distill_max_tokens, max_tokens_bound_state]
         )
 
         # 源文件变化事件（自动检测字段）
@@ -531,18 +560,20 @@ class DistillTabManager:
             outputs=[dataset_fields_box, selected_fields_input, dataset_single_field_dropdown]
         )
 
-        # 字段复选框变化事件（同步到文本框）
+        # 字段复选框变化事件（同步到文本框，逗号分隔）：纯字符串拼接，在浏览器端完成，无需请求后端
         dataset_fields_box.change(
-            fn=self._sync_selected_fields_text,
+            fn=None,
             inputs=[dataset_fields_box],
-            outputs=[selected_fields_input]
+            outputs=[selected_fields_input],
+            js="(fields) => (fields || []).join(',')"
         )
 
-        # 单选字段下拉框变化事件（同步到文本框）
+        # 单选字段下拉框变化事件（同步到文本框），同样在浏览器端完成
         dataset_single_field_dropdown.change(
-            fn=self._sync_source_field_text,
+            fn=None,
             inputs=[dataset_single_field_dropdown],
-            outputs=[source_field_input]
+            outputs=[source_field_input],
+            js="(field) => field || ''"
         )
         
         # (已移除重复的 select 绑定，合并至上方的 _on_task_list_select)
@@ -554,7 +585,9 @@ class DistillTabManager:
             
         refresh_models_btn.click(
             fn=refresh_model_choices,
-            outputs=[distill_model, resume_model_override]
+            outputs=[distill_model, resume_model_override],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
 
         # 页面加载时触发一次策略更新，确保初始状态正确
@@ -779,35 +812,17 @@ class DistillTabManager:
             df_state = df.copy(deep=True) if hasattr(df, 'copy') else df
             return f"批量启动失败: {str(e)}", df, df_state
 
-    def _pause_distill_generation(self, task_id: str, selected_ids=None) -> Tuple[str, Any]:
-        """暂停蒸馏生成（单任务）"""
-        try:
-            if not task_id or not task_id.strip():
-                return "请选择要暂停的任务", self._get_distill_tasks_df()
-            
-            # 这里由于distill_generator没有pause方法，我们更新状态
-            state_manager.update_state(task_id.strip(), 'status', 'paused')
-            
-            df = self._get_distill_tasks_df()
-            df = self._apply_selection_state(df, selected_ids)
-            df_state = df.copy(deep=True) if hasattr(df, 'copy') else df
-            return f"任务已暂停: {task_id}", df, df_state
-            
-        except Exception as e:
-            self.logger.error(f'暂停蒸馏生成失败: {e}')
-            df = self._get_distill_tasks_df()
-            df = self._apply_selection_state(df, selected_ids)
-            df_state = df.copy(deep=True) if hasattr(df, 'copy') else df
-            return f"暂停失败: {str(e)}", df, df_state
-
     def _refresh_distill_tasks(self) -> Any:
         """刷新蒸馏任务列表"""
         return self._get_distill_tasks_df()
 
-    def _pause_multiple_tasks(self, task_df, selected_ids=None) -> Tuple[str, Any, Any]:
-        """批量暂停任务"""
+    def _pause_multiple_tasks(self, task_df, selected_ids=None, task_ids=None) -> Tuple[str, Any, Any]:
+        """批量暂停任务
+
+        task_ids 不为 None 时直接暂停这些任务（左侧单任务暂停按钮），不再从表格或 State 中提取选择。
+        """
         try:
-            selected_tasks = self._extract_selected_ids(task_df, selected_ids)
+            selected_tasks = task_ids if task_ids is not None else self._extract_selected_ids(task_df, selected_ids)
             if not selected_tasks:
                 df = self._get_distill_tasks_df()
                 df = self._apply_selection_state(df, selected_ids)
@@ -818,22 +833,31 @@ class DistillTabManager:
             failed_count = 0
             results = []
             
+            errors = []
+            
             for task_id in selected_tasks:
                 try:
+                    # 这里由于distill_generator没有pause方法，我们更新状态
                     state_manager.update_state(task_id, 'status', 'paused')
                     success_count += 1
                     results.append(f"✅ {task_id}")
                 except Exception as e:
                     failed_count += 1
+                    errors.append(str(e))
                     results.append(f"❌ {task_id}: {str(e)}")
             
-            summary = f"批量暂停完成: {success_count}个成功, {failed_count}个失败"
-            details = "\n".join(results)
+            if task_ids is not None and len(selected_tasks) == 1:
+                # 单任务沿用简短提示
+                message = f"任务已暂停: {selected_tasks[0]}" if success_count else f"暂停失败: {errors[0]}"
+            else:
+                summary = f"批量暂停完成: {success_count}个成功, {failed_count}个失败"
+                details = "\n".join(results)
+                message = f"{summary}\n\n详情:\n{details}"
             
             df = self._get_distill_tasks_df()
             df = self._apply_selection_state(df, selected_ids)
             df_state = df.copy(deep=True) if hasattr(df, 'copy') else df
-            return f"{summary}\n\n详情:\n{details}", df, df_state
+            return message, df, df_state
                 
         except Exception as e:
             self.logger.error(f'批量暂停任务失败: {e}')
@@ -991,30 +1015,23 @@ class DistillTabManager:
             df_state = df.copy(deep=True) if hasattr(df, 'copy') else df
             return f"恢复失败: {str(e)}", df, df_state
 
-    def _on_distill_model_change(self, model_name: str) -> Dict[str, Any]:
-        """根据模型类型动态调整 max_tokens 上限与提示"""
+    def _on_distill_model_change(self, model_name: str, last_bound=None) -> Tuple[Any, Any]:
+        """根据模型类型动态调整 max_tokens 上限与提示（与本会话上次下发的相同时跳过）"""
         try:
             if not model_name:
-                return gr.update()
+                return gr.skip(), gr.skip()
             # 获取该模型配置
             all_models = model_manager.get_all_models()
             cfg = all_models.get(model_name) if isinstance(all_models, dict) else None
             mtype = (cfg.get('type') or '').upper() if cfg else ''
 
-            # 设定上限与说明
-            if mtype == 'OPENAI':
-                max_cap = 8192
-                info = "最大Token数（OPENAI 兼容：建议<=8192，超出可能报错）"
-            elif mtype in ('VLLM', 'OLLAMA', 'SGLANG'):
-                max_cap = 200000
-                info = "最大Token数（本地/兼容后端：已放宽至 200000，请按模型上下文限制合理设置）"
-            else:
-                max_cap = 4000
-                info = "最大Token数（未知后端：保持默认上限 4000）"
-
-            return gr.update(maximum=max_cap, info=info)
+            bound = MAX_TOKENS_BOUNDS.get(mtype, DEFAULT_MAX_TOKENS_BOUND)
+            if bound == last_bound:
+                return gr.skip(), gr.skip()
+            max_cap, info = bound
+            return gr.update(maximum=max_cap, info=info), bound
         except Exception:
-            return gr.update()
+            return gr.skip(), gr.skip()
 
     def _on_distill_source_change(self, source_file) -> Tuple[Dict[str, Any], str, Dict[str, Any]]:
         """选择源数据文件后，扫描若干行推断字段列表，填充字段复选框并同步文本框"""
@@ -1076,19 +1093,6 @@ class DistillTabManager:
             self.logger.error(f'源文件字段检测失败: {e}')
             return gr.update(choices=[], value=[]), "", gr.update(choices=[], value=None)
 
-    def _sync_selected_fields_text(self, selected_list: list) -> str:
-        """将复选框选择同步到文本框（逗号分隔）"""
-        try:
-            if not selected_list:
-                return ""
-            return ",".join(selected_list)
-        except Exception:
-            return ""
-
-    def _sync_source_field_text(self, selected_field: str) -> str:
-        """同步单选下拉框到文本框"""
-        return selected_field if selected_field else ""
-    
     def _select_distill_task(self, evt: gr.SelectData) -> Tuple[Any, ...]:
         """选择蒸馏任务并回填参数"""
         task_id = ""
@@ -1198,41 +1202,15 @@ class DistillTabManager:
             if not tasks:
                 return pd.DataFrame(columns=["选择", "任务ID", "策略", "模型", "状态", "进度", "开始时间"])
             
-            # 构建数据框
-            rows = []
+            # 逐任务取值，按列构建数据框
+            task_ids, strategies, model_ids, statuses, progresses, start_times = [], [], [], [], [], []
             for task in tasks:
-                task_id = task.get('task_id', '')
                 params = task.get('params', {})
                 strategy = params.get('strategy', '')
-                model_id = params.get('model_id', '')
                 status = task.get('status', 'unknown')
                 progress = task.get('progress', 0)
                 start_time = task.get('start_time', '')
                 
-                # 状态中文映射
-                status_map = {
-                    'pending': '等待中',
-                    'running': '生成中',
-                    'paused': '已暂停',
-                    'completed': '已完成',
-                    'failed': '失败'
-                }
-                
-                status_cn = status_map.get(status, status)
-                progress_str = f"{progress:.1f}%" if isinstance(progress, (int, float)) else "0%"
-                
-                # 策略中文映射
-                strategy_map = {
-                    'expand': '数据扩充',
-                    'enhance': '内容增强',
-                    'paraphrase': '文本改写',
-                    'classify_label': '分类标注',
-                    'q_to_a': '从Q生A',
-                    'custom': '自定义'
-                }
-                
-                strategy_cn = strategy_map.get(strategy, strategy)
-                
                 # 格式化开始时间
                 if start_time:
                     try:
@@ -1243,17 +1221,22 @@ class DistillTabManager:
                 else:
                     start_time_str = ""
                 
-                rows.append([
-                    False, # 默认不选中
-                    task_id,
-                    strategy_cn,
-                    model_id,
-                    status_cn,
-                    progress_str,
-                    start_time_str
-                ])
+                task_ids.append(task.get('task_id', ''))
+                strategies.append(DISTILL_STRATEGY_LABELS.get(strategy, strategy))
+                model_ids.append(params.get('model_id', ''))
+                statuses.append(DISTILL_STATUS_LABELS.get(status, status))
+                progresses.append(f"{progress:.1f}%" if isinstance(progress, (int, float)) else "0%")
+                start_times.append(start_time_str)
             
-            return pd.DataFrame(rows, columns=["选择", "任务ID", "策略", "模型", "状态", "进度", "开始时间"])
+            return pd.DataFrame({
+                "选择": [False] * len(task_ids),  # 默认不选中
+                "任务ID": task_ids,
+                "策略": strategies,
+                "模型": model_ids,
+                "状态": statuses,
+                "进度": progresses,
+                "开始时间": start_times
+            })
             
         except Exception as e:
             self.logger.error(f'获取蒸馏任务列表失败: {e}')
@@ -1,13 +1,81 @@
+import time
+import threading
 import gradio as gr
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Tuple, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, List, Optional
 from ..dependencies import pd
 
+DOWNLOAD_TASK_COLUMNS = ["选择", "任务ID", "数据集名称", "状态", "进度", "开始时间"]
+
+# 没有进行中任务时的自动刷新间隔（秒）
+IDLE_REFRESH_INTERVAL = 5
+
+# 多个会话或操作在此时间窗口（秒）内的刷新合并为一次任务查询
+REFRESH_COALESCE_SECONDS = 0.25
+
+# 不会再自行变化的任务状态
+IDLE_STATUSES = ('completed', 'failed')
+
+# 任务列表每页显示的任务数
+_TASKS_PER_PAGE = 100
+
+# 支持的数据源类型（与下拉框选项一致）
+_ALLOWED_SOURCES = ('huggingface', 'modelscope', 'url')
+
+# 状态中文映射（只读）
+STATUS_MAP = MappingProxyType({
+    'pending': '等待中',
+    'running': '下载中',
+    'paused': '已暂停',
+    'completed': '已完成',
+    'failed': '失败'
+})
+
+@lru_cache(maxsize=4096)
+def _format_task_row(entry: tuple) -> tuple:
+    """将 (任务ID, 数据集名称, 状态, 进度, 开始时间) 格式化为显示行，结果按任务字段缓存"""
+    task_id, dataset_name, status, progress, start_time = entry
+    status_cn = STATUS_MAP.get(status, status)
+    progress_str = f"{progress:.1f}%" if isinstance(progress, (int, float)) else "0%"
+    
+    # 格式化开始时间：常见的 YYYY-MM-DDTHH:MM... 直接切片，其余格式再交给 fromisoformat
+    if start_time and len(start_time) >= 16 and start_time[4] == '-' and start_time[7] == '-' \
+            and start_time[10] in 'T ' and start_time[13] == ':':
+        start_time_str = f"{start_time[5:10]} {start_time[11:16]}"
+    elif start_time:
+        try:
+            dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+            start_time_str = dt.strftime('%m-%d %H:%M')
+        except:
+            start_time_str = start_time[:16] if len(start_time) > 16 else start_time
+    else:
+        start_time_str = ""
+    
+    return (
+        task_id,
+        dataset_name,
+        status_cn,
+        progress_str,
+        start_time_str
+    )
+
 class DownloadTabManager:
     def __init__(self, launcher):
         self.launcher = launcher
         self.logger = launcher.logger
         self.dataset_downloader = launcher.dataset_downloader
+        # 最近一次构建的任务列表: ((签名, 显示行), 任务变更代数, 是否有进行中任务, 查询时刻)
+        # 所有会话共用，任务无变化时不重复格式化；有进行中任务时进度需轮询获取，仅在合并窗口内复用
+        self._tasks_view_cache: Optional[Tuple[Tuple[Any, Tuple[tuple, ...]], int, bool, float]] = None
+        self._refresh_lock = threading.Lock()
+        # 最近一次构建的未选中数据框: (显示行, 页码, DataFrame)，显示行与页码不变时直接复用
+        self._tasks_df_cache: Optional[Tuple[Tuple[tuple, ...], int, pd.DataFrame]] = None
+        # 批量启动/暂停/删除任务的线程池
+        batch_workers = max(1, int(launcher.config_manager.get_config('download.batch_workers', 8) or 1))
+        self._task_pool = ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix="ui-taskop")
         
     def create_tab(self):
         """创建数据集下载标签页"""
@@ -100,6 +168,12 @@ class DownloadTabManager:
                     value=self._get_download_tasks_df()
                 )
                 
+                # 分页区域
+                with gr.Row():
+                    prev_page_btn = gr.Button("◀", size="sm", scale=0, min_width=60)
+                    page_info = gr.Markdown(self._get_page_info(0))
+                    next_page_btn = gr.Button("▶", size="sm", scale=0, min_width=60)
+                
                 # 任务选择区域
                 with gr.Row():
                     start_task_btn = gr.Button("启动", size="sm", variant="primary")
@@ -118,14 +192,20 @@ class DownloadTabManager:
         
         # 添加隐藏的定时器，用于自动刷新任务列表
         with gr.Row(visible=False):
-            auto_refresh_timer = gr.Timer(value=2)
+            auto_refresh_timer = gr.Timer(value=self.launcher.update_interval)
         
-        # 使用 State 存储选中的任务ID，避免 Dataframe 输入问题
-        selected_tasks_state = gr.State(value=set())
+        # 使用 State 存储选中的任务ID（不可变 frozenset，定时刷新的渲染键可直接复用），避免 Dataframe 输入问题
+        selected_tasks_state = gr.State(value=frozenset())
 
         # 使用 State 存储当前 Dataframe 数据，供 select 事件使用
         current_df_state = gr.State(value=pd.DataFrame())
 
+        # 本会话最近一次推送的 (任务变更代数, 是否有进行中任务, 任务签名, 选中ID, 页码)，定时刷新时用于跳过无变化的更新
+        render_key_state = gr.State(value=None)
+
+        # 本会话任务列表的当前页码（从0开始），各会话独立翻页
+        task_page_state = gr.State(value=0)
+
         # 绑定 Dataframe 选择事件，更新 State
         def _on_df_select(evt: gr.SelectData, df_value, current_selection):
             try:
@@ -138,13 +218,10 @@ class DownloadTabManager:
 
                     task_id = str(df_value.iloc[row_index, 1])  # 确保ID是字符串
 
-                    new_selection = set(current_selection or set())
-                    if task_id in new_selection:
-                        new_selection.discard(task_id)
-                    else:
-                        new_selection.add(task_id)
-
-                    return new_selection
+                    current = frozenset(current_selection or ())
+                    if task_id in current:
+                        return current - {task_id}
+                    return current | {task_id}
 
                 return current_selection
             except Exception as e:
@@ -154,13 +231,46 @@ class DownloadTabManager:
         task_list.select(
             fn=_on_df_select,
             inputs=[current_df_state, selected_tasks_state],
-            outputs=[selected_tasks_state]
+            outputs=[selected_tasks_state],
+            queue=False
         )
         
         # 刷新逻辑改为读取 State
-        def _refresh_with_state(selected_ids: set):
-            new_df = self._refresh_download_tasks_logic_with_state(selected_ids)
-            return new_df, new_df
+        def _refresh_with_state(selected_ids: set, page: int):
+            view = self._get_download_tasks_view()
+            # 页码可能因任务减少而超出范围，收回后写回本会话
+            page = self._clamp_page(page, len(view[1]))
+            new_df = self._refresh_download_tasks_logic_with_state(selected_ids, view, page)
+            return new_df, new_df, self._get_page_info(page), page
+
+        # 翻页
+        def _change_page(delta: int, selected_ids: set, page: int):
+            return _refresh_with_state(selected_ids, max(0, (page or 0) + delta))
+
+        # 定时刷新：任务列表与选择均未变化时跳过本次更新，不重新发送表格
+        def _auto_refresh_with_state(selected_ids: set, last_key, page: int):
+            generation = self.dataset_downloader.get_task_generation()
+            selection = frozenset(selected_ids or ())
+            page = page or 0
+            # 没有进行中的任务，且任务未增删、状态未切换时，无需查询任务列表
+            if (last_key is not None and not last_key[1] and last_key[0] == generation
+                    and last_key[3:] == (selection, page)):
+                return gr.skip(), gr.skip(), last_key, gr.skip(), gr.skip(), gr.skip()
+            
+            view = self._get_download_tasks_view()
+            active = view[0] is None or any(entry[2] not in IDLE_STATUSES for entry in view[0])
+            # 有进行中任务时按 update_interval 轮询进度，否则放慢心跳
+            if last_key is None or last_key[1] != active:
+                timer = gr.Timer(value=self.launcher.update_interval if active else IDLE_REFRESH_INTERVAL)
+            else:
+                timer = gr.skip()
+            if view[0] is not None and last_key is not None and last_key[2:] == (view[0], selection, page):
+                return gr.skip(), gr.skip(), (generation, active) + last_key[2:], timer, gr.skip(), gr.skip()
+            # 页码可能因任务减少而被收回，记录实际页码
+            page = self._clamp_page(page, len(view[1]))
+            new_df = self._refresh_download_tasks_logic_with_state(selected_ids, view, page)
+            key = (generation, active, view[0], selection, page)
+            return new_df, new_df, key, timer, self._get_page_info(page), page
 
         # 存储组件引用
         self.launcher.components['download'] = {
@@ -174,71 +284,97 @@ class DownloadTabManager:
             'status': download_status,
             'auto_refresh_timer': auto_refresh_timer,
             'selected_tasks_state': selected_tasks_state,
-            'current_df_state': current_df_state
+            'current_df_state': current_df_state,
+            'task_page_state': task_page_state
         }
         
         # 绑定事件处理器
         add_task_btn.click(
             fn=self._add_download_task,
-            inputs=[source_type, dataset_name, huggingface_token, modelscope_token, use_hf_mirror, save_dir],
+            inputs=[source_type, dataset_name, huggingface_token, modelscope_token, use_hf_mirror, save_dir, task_page_state],
             outputs=[download_status, task_list, current_df_state]
         )
         
         # 自动刷新
         auto_refresh_timer.tick(
-            fn=_refresh_with_state,
-            inputs=[selected_tasks_state],
-            outputs=[task_list, current_df_state]
+            fn=_auto_refresh_with_state,
+            inputs=[selected_tasks_state, render_key_state, task_page_state],
+            outputs=[task_list, current_df_state, render_key_state, auto_refresh_timer, page_info, task_page_state],
+            show_progress="hidden"
         )
         
         # 左侧刷新（配置区）
         refresh_status_btn.click(
             fn=_refresh_with_state,
-            inputs=[selected_tasks_state],
-            outputs=[task_list, current_df_state]
+            inputs=[selected_tasks_state, task_page_state],
+            outputs=[task_list, current_df_state, page_info, task_page_state],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         # 右侧刷新（任务区）
         try:
             refresh_list_btn.click(
                 fn=_refresh_with_state,
-                inputs=[selected_tasks_state],
-                outputs=[task_list, current_df_state]
+                inputs=[selected_tasks_state, task_page_state],
+                outputs=[task_list, current_df_state, page_info, task_page_state],
+                concurrency_limit=self.launcher.refresh_concurrency,
+                concurrency_id="ui_refresh"
             )
         except Exception:
             pass
         
+        # 翻页
+        prev_page_btn.click(
+            fn=lambda selected_ids, page: _change_page(-1, selected_ids, page),
+            inputs=[selected_tasks_state, task_page_state],
+            outputs=[task_list, current_df_state, page_info, task_page_state]
+        )
+        
+        next_page_btn.click(
+            fn=lambda selected_ids, page: _change_page(1, selected_ids, page),
+            inputs=[selected_tasks_state, task_page_state],
+            outputs=[task_list, current_df_state, page_info, task_page_state]
+        )
+        
         # 批量任务操作
         start_task_btn.click(
             fn=self._start_multiple_tasks,
-            inputs=[current_df_state],
+            inputs=[current_df_state, task_page_state],
             outputs=[download_status, task_list, current_df_state]
         )
         
         pause_task_btn.click(
             fn=self._pause_multiple_tasks,
-            inputs=[current_df_state],
+            inputs=[current_df_state, task_page_state],
             outputs=[download_status, task_list, current_df_state]
         )
         
         delete_task_btn.click(
             fn=self._delete_multiple_tasks,
-            inputs=[current_df_state],
+            inputs=[current_df_state, task_page_state],
             outputs=[download_status, task_list, current_df_state]
         )
 
     def _add_download_task(self, source_type: str, dataset_name: str, 
                           huggingface_token: str, modelscope_token: str, 
-                          use_hf_mirror: bool, save_dir: str) -> Tuple[str, Any, Any]:
+                          use_hf_mirror: bool, save_dir: str, page: int = 0) -> Tuple[str, Any, Any]:
         """添加下载任务"""
         try:
             if not dataset_name.strip():
-                df = self._get_download_tasks_df()
+                df = self._get_download_tasks_df(page)
                 return "请输入数据集名称或URL", df, df
             
+            # 下拉框的值已是规范形式，仅在不匹配时再做规范化
+            if source_type not in _ALLOWED_SOURCES:
+                source_type = (source_type or '').strip().lower()
+                if source_type not in _ALLOWED_SOURCES:
+                    df = self._get_download_tasks_df(page)
+                    return f"不支持的数据源类型: {source_type}", df, df
+            
             # 构建下载参数
             params = {
-                'source_type': (source_type or '').strip().lower(),
+                'source_type': source_type,
                 'dataset_name': dataset_name.strip(),
                 'save_dir': (save_dir.strip() if save_dir else str(self.launcher.root_dir / "raw")),
                 'extra_params': {}
@@ -249,22 +385,20 @@ class DownloadTabManager:
                 params['extra_params']['use_hf_mirror'] = True
             
             # 根据source_type选择合适的token并保存
-            if params['source_type'] == 'huggingface' and huggingface_token.strip():
-                params['token'] = huggingface_token.strip()
-                self.launcher._save_token('huggingface', huggingface_token.strip())
-            elif params['source_type'] == 'modelscope' and modelscope_token.strip():
-                params['token'] = modelscope_token.strip()
-                self.launcher._save_token('modelscope', modelscope_token.strip())
+            token = ({'huggingface': huggingface_token, 'modelscope': modelscope_token}.get(source_type) or '').strip()
+            if token:
+                params['token'] = token
+                self.launcher._save_token(source_type, token)
             
             # 调用核心模块添加任务（解包参数）
             task_id = self.dataset_downloader.add_download_task(**params)
             
-            df = self._get_download_tasks_df()
+            df = self._get_download_tasks_df(page)
             return f"下载任务已添加: {task_id}", df, df
             
         except Exception as e:
             self.logger.error(f'添加下载任务失败: {e}')
-            df = self._get_download_tasks_df()
+            df = self._get_download_tasks_df(page)
             return f"添加任务失败: {str(e)}", df, df
     
     def _refresh_download_tasks(self) -> Any:
@@ -285,220 +419,222 @@ class DownloadTabManager:
                 except Exception:
                     pass
             
-            # 获取最新的任务列表数据
-            new_df = self._get_download_tasks_df()
-            
-            # 如果有之前的选择，重新应用到新数据上
-            if selected_ids and not new_df.empty:
-                # 使用 apply 函数更新第一列
-                # 注意：这里假设第1列是任务ID
-                new_df.iloc[:, 0] = new_df.iloc[:, 1].apply(lambda x: x in selected_ids)
-                
-            return new_df
+            # 获取最新的任务列表数据，并重新应用之前的选择
+            return self._refresh_download_tasks_logic_with_state({str(task_id) for task_id in selected_ids})
         except Exception as e:
             self.logger.error(f'刷新下载任务列表失败: {e}')
             return self._get_download_tasks_df()
 
-    def _refresh_download_tasks_logic_with_state(self, selected_ids: set) -> pd.DataFrame:
-        """刷新下载任务列表，并应用 State 中的选择状态"""
+    def _refresh_download_tasks_logic_with_state(self, selected_ids: set, view: Optional[Tuple[Any, Tuple[tuple, ...]]] = None,
+                                                 page: int = 0) -> pd.DataFrame:
+        """刷新下载任务列表第 page 页，并应用 State 中的选择状态（可传入已获取的任务视图，避免重复查询）"""
         try:
-            # 获取最新的任务列表数据
-            new_df = self._get_download_tasks_df()
-            
-            # 如果有之前的选择，重新应用到新数据上
-            if selected_ids and not new_df.empty:
-                # 使用 apply 函数更新第一列
-                # 注意：这里假设第1列是任务ID
-                new_df.iloc[:, 0] = new_df.iloc[:, 1].apply(lambda x: str(x) in selected_ids)
-                
-            return new_df
+            # 获取最新的任务列表数据，构建时直接填入之前的选择
+            if view is None:
+                view = self._get_download_tasks_view()
+            return self._build_tasks_df(self._page_rows(view[1], page), selected_ids)
         except Exception as e:
             self.logger.error(f'刷新下载任务列表失败: {e}')
-            return self._get_download_tasks_df()
+            return self._get_download_tasks_df(page)
+
+    @staticmethod
+    def _get_selected_task_ids(task_df: pd.DataFrame) -> List[str]:
+        """获取表格中勾选的任务ID (第一列为True的行)，去重并保持顺序"""
+        if task_df is None or task_df.empty:
+            return []
+        selected = task_df.iloc[:, 1][task_df.iloc[:, 0] == True]
+        return list(dict.fromkeys(str(task_id) for task_id in selected))
+
+    @staticmethod
+    def _summarize_batch(title: str, outcomes: List[Tuple[str, bool, Optional[Exception]]]) -> str:
+        """汇总批量操作结果，outcomes 为 (任务ID, 是否成功, 异常) 列表"""
+        success_count = sum(1 for _, success, _ in outcomes if success)
+        details = "\n".join(
+            f"✅ {task_id}" if success else (f"❌ {task_id}: {error}" if error is not None else f"❌ {task_id}")
+            for task_id, success, error in outcomes
+        )
+        return f"{title}: {success_count}个成功, {len(outcomes) - success_count}个失败\n\n详情:\n{details}"
 
-    def _start_multiple_tasks(self, task_df: pd.DataFrame) -> Tuple[str, Any, Any]:
+    def _start_multiple_tasks(self, task_df: pd.DataFrame, page: int = 0) -> Tuple[str, Any, Any]:
         """批量开始任务"""
         try:
-            if task_df is None or task_df.empty:
-                df = self._get_download_tasks_df()
+            selected_tasks = self._get_selected_task_ids(task_df)
+            if not selected_tasks:
+                df = self._get_download_tasks_df(page)
                 return "请先选择要开始的任务", df, df
             
-            # 获取选中的任务ID (第一列为True的行)
-            selected_rows = task_df[task_df.iloc[:, 0] == True]
-            if selected_rows.empty:
-                return "请先选择要开始的任务", df, df
-                
-            selected_tasks = selected_rows.iloc[:, 1].tolist()
-            
-            success_count = 0
-            failed_count = 0
-            results = []
+            outcomes = []
             
-            for task_id in selected_tasks:
+            # 并发提交各任务，结果按选择顺序汇总
+            futures = [
+                (task_id, self._task_pool.submit(self.dataset_downloader.start_task, task_id, async_mode=True))
+                for task_id in selected_tasks
+            ]
+            for task_id, future in futures:
                 try:
-                    success = self.dataset_downloader.start_task(task_id, async_mode=True)
-                    if success:
-                        success_count += 1
-                        results.append(f"✅ {task_id}")
-                    else:
-                        failed_count += 1
-                        results.append(f"❌ {task_id}")
+                    outcomes.append((task_id, future.result(), None))
                 except Exception as e:
-                    failed_count += 1
-                    results.append(f"❌ {task_id}: {str(e)}")
+                    outcomes.append((task_id, False, e))
             
-            summary = f"批量启动完成: {success_count}个成功, {failed_count}个失败"
-            details = "\n".join(results)
-            
-            df = self._get_download_tasks_df()
-            return f"{summary}\n\n详情:\n{details}", df, df
+            df = self._get_download_tasks_df(page)
+            return self._summarize_batch("批量启动完成", outcomes), df, df
                 
         except Exception as e:
             self.logger.error(f'批量启动任务失败: {e}')
-            df = self._get_download_tasks_df()
+            df = self._get_download_tasks_df(page)
             return f"批量启动失败: {str(e)}", df, df
 
-    def _pause_multiple_tasks(self, task_df: pd.DataFrame) -> Tuple[str, Any, Any]:
+    def _pause_multiple_tasks(self, task_df: pd.DataFrame, page: int = 0) -> Tuple[str, Any, Any]:
         """批量暂停任务"""
         try:
-            if task_df is None or task_df.empty:
-                df = self._get_download_tasks_df()
-                return "请先选择要暂停的任务", df, df
-            
-            # 获取选中的任务ID (第一列为True的行)
-            selected_rows = task_df[task_df.iloc[:, 0] == True]
-            if selected_rows.empty:
+            selected_tasks = self._get_selected_task_ids(task_df)
+            if not selected_tasks:
+                df = self._get_download_tasks_df(page)
                 return "请先选择要暂停的任务", df, df
-                
-            selected_tasks = selected_rows.iloc[:, 1].tolist()
             
-            success_count = 0
-            failed_count = 0
-            results = []
+            outcomes = []
             
-            for task_id in selected_tasks:
+            # 并发提交各任务，结果按选择顺序汇总
+            futures = [
+                (task_id, self._task_pool.submit(self.dataset_downloader.pause_task, task_id))
+                for task_id in selected_tasks
+            ]
+            for task_id, future in futures:
                 try:
-                    success = self.dataset_downloader.pause_task(task_id)
-                    if success:
-                        success_count += 1
-                        results.append(f"✅ {task_id}")
-                    else:
-                        failed_count += 1
-                        results.append(f"❌ {task_id}")
+                    outcomes.append((task_id, future.result(), None))
                 except Exception as e:
-                    failed_count += 1
-                    results.append(f"❌ {task_id}: {str(e)}")
+                    outcomes.append((task_id, False, e))
             
-            summary = f"批量暂停完成: {success_count}个成功, {failed_count}个失败"
-            details = "\n".join(results)
-            
-            df = self._get_download_tasks_df()
-            return f"{summary}\n\n详情:\n{details}", df, df
+            df = self._get_download_tasks_df(page)
+            return self._summarize_batch("批量暂停完成", outcomes), df, df
                 
         except Exception as e:
             self.logger.error(f'批量暂停任务失败: {e}')
-            df = self._get_download_tasks_df()
+            df = self._get_download_tasks_df(page)
             return f"批量暂停失败: {str(e)}", df, df
 
-    def _delete_multiple_tasks(self, task_df: pd.DataFrame) -> Tuple[str, Any, Any]:
+    def _delete_multiple_tasks(self, task_df: pd.DataFrame, page: int = 0) -> Tuple[str, Any, Any]:
         """批量删除任务"""
         try:
-            if task_df is None or task_df.empty:
-                df = self._get_download_tasks_df()
-                return "请先选择要删除的任务", df, df
-            
-            # 获取选中的任务ID (第一列为True的行)
-            selected_rows = task_df[task_df.iloc[:, 0] == True]
-            if selected_rows.empty:
+            selected_tasks = self._get_selected_task_ids(task_df)
+            if not selected_tasks:
+                df = self._get_download_tasks_df(page)
                 return "请先选择要删除的任务", df, df
-                
-            selected_tasks = selected_rows.iloc[:, 1].tolist()
             
-            success_count = 0
-            failed_count = 0
-            results = []
+            outcomes = []
             
-            for task_id in selected_tasks:
+            # 并发提交各任务，结果按选择顺序汇总
+            futures = [
+                (task_id, self._task_pool.submit(self.dataset_downloader.delete_task, task_id))
+                for task_id in selected_tasks
+            ]
+            for task_id, future in futures:
                 try:
-                    success = self.dataset_downloader.delete_task(task_id)
-                    if success:
-                        success_count += 1
-                        results.append(f"✅ {task_id}")
-                    else:
-                        failed_count += 1
-                        results.append(f"❌ {task_id}")
+                    outcomes.append((task_id, future.result(), None))
                 except Exception as e:
-                    failed_count += 1
-                    results.append(f"❌ {task_id}: {str(e)}")
-            
-            summary = f"批量删除完成: {success_count}个成功, {failed_count}个失败"
-            details = "\n".join(results)
+                    outcomes.append((task_id, False, e))
             
-            df = self._get_download_tasks_df()
-            return f"{summary}\n\n详情:\n{details}", df, df
+            df = self._get_download_tasks_df(page)
+            return self._summarize_batch("批量删除完成", outcomes), df, df
                 
         except Exception as e:
             self.logger.error(f'批量删除任务失败: {e}')
-            df = self._get_download_tasks_df()
+            df = self._get_download_tasks_df(page)
             return f"批量删除失败: {str(e)}", df, df
 
-    def _get_download_tasks_df(self) -> Any:
-        """获取下载任务列表数据框"""
+    def _get_download_tasks_df(self, page: int = 0) -> Any:
+        """获取下载任务列表数据框（第 page 页，未选中）
+
+        任务与页码未变化时返回同一个数据框对象，调用方不要原地修改。
+        """
+        rows = self._get_download_tasks_view()[1]
+        page = self._clamp_page(page, len(rows))
+        cached = self._tasks_df_cache
+        if cached is not None and cached[0] is rows and cached[1] == page:
+            return cached[2]
+        df = self._build_tasks_df(self._page_rows(rows, page))
+        self._tasks_df_cache = (rows, page, df)
+        return df
+
+    @staticmethod
+    def _clamp_page(page: int, total: int) -> int:
+        """将页码限制在 [0, 总页数) 内，超出范围时收回到最后一页"""
+        page_count = max(1, -(-total // _TASKS_PER_PAGE))
+        return min(max(0, page or 0), page_count - 1)
+
+    @classmethod
+    def _page_rows(cls, rows: Tuple[tuple, ...], page: int) -> Tuple[tuple, ...]:
+        """截取第 page 页的显示行，页码超出范围时取最后一页"""
+        start = cls._clamp_page(page, len(rows)) * _TASKS_PER_PAGE
+        return rows[start:start + _TASKS_PER_PAGE]
+
+    def _get_page_info(self, page: int) -> str:
+        """获取第 page 页的分页信息文本"""
+        total = len(self._get_download_tasks_view()[1])
+        page_count = max(1, -(-total // _TASKS_PER_PAGE))
+        return f"第 {self._clamp_page(page, total) + 1}/{page_count} 页，共 {total} 个任务"
+
+    @staticmethod
+    def _build_tasks_df(rows: Tuple[tuple, ...], selected_ids=()) -> pd.DataFrame:
+        """由显示行一次性构建数据框，第一列为是否选中"""
+        return pd.DataFrame(
+            [(str(row[0]) in selected_ids,) + row for row in rows],
+            columns=DOWNLOAD_TASK_COLUMNS
+        )
+
+    def _get_download_tasks_view(self) -> Tuple[Any, Tuple[tuple, ...]]:
+        """获取下载任务列表签名及显示行（不含选择列）
+
+        只调用一次 list_tasks()；签名由各任务的显示字段组成，与上次相同时直接复用缓存的显示行。
+        任务变更代数未变时，若没有进行中的任务，或距上次查询不足 REFRESH_COALESCE_SECONDS 秒，
+        直接复用上次结果；多个会话同时刷新时串行执行，后到的请求复用先到的结果。
+        """
         try:
-            # 获取所有下载任务
-            tasks = self.dataset_downloader.list_tasks()
-            
-            if not tasks:
-                return pd.DataFrame(columns=["选择", "任务ID", "数据集名称", "状态", "进度", "开始时间"])
-            
-            # 构建数据框
-            rows = []
-            for task in tasks:
-                task_id = task.get('task_id', '')
-                params = task.get('params', {})
-                progress_info = task.get('progress', {})
-                
-                dataset_name = params.get('dataset_name', '')
-                status = progress_info.get('status', 'unknown')
-                progress = progress_info.get('progress', 0)
-                start_time = progress_info.get('start_time', '')
+            with self._refresh_lock:
+                generation = self.dataset_downloader.get_task_generation()
+                now = time.monotonic()
+                cached = self._tasks_view_cache
+                if cached is not None and cached[1] == generation and (
+                        not cached[2] or now - cached[3] < REFRESH_COALESCE_SECONDS):
+                    return cached[0]
                 
-                # 状态中文映射
-                status_map = {
-                    'pending': '等待中',
-                    'running': '下载中',
-                    'paused': '已暂停',
-                    'completed': '已完成',
-                    'failed': '失败'
-                }
+                # 获取所有下载任务
+                tasks = self.dataset_downloader.list_tasks()
                 
-                status_cn = status_map.get(status, status)
-                progress_str = f"{progress:.1f}%" if isinstance(progress, (int, float)) else "0%"
+                # 提取显示字段，同时作为签名
+                entries = []
+                for task in tasks:
+                    params = task.get('params', {})
+                    progress_info = task.get('progress', {})
+                    entries.append((
+                        task.get('task_id', ''),
+                        params.get('dataset_name', ''),
+                        progress_info.get('status', 'unknown'),
+                        progress_info.get('progress', 0),
+                        progress_info.get('start_time', '')
+                    ))
+                sig = tuple(entries)
+                active = any(entry[2] not in IDLE_STATUSES for entry in entries)
+                if cached is not None and cached[0][0] == sig:
+                    self._tasks_view_cache = (cached[0], generation, active, now)
+                    return cached[0]
                 
-                # 格式化开始时间
-                if start_time:
+                # 格式化显示行：未变化的任务直接命中缓存，只有变化的行重新格式化
+                rows = []
+                for entry in entries:
                     try:
-                        dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                        start_time_str = dt.strftime('%m-%d %H:%M')
-                    except:
-                        start_time_str = start_time[:16] if len(start_time) > 16 else start_time
-                else:
-                    start_time_str = ""
+                        rows.append(_format_task_row(entry))
+                    except TypeError:
+                        # 字段不可哈希时不走缓存
+                        rows.append(_format_task_row.__wrapped__(entry))
                 
-                rows.append([
-                    False, # 默认不选中
-                    task_id,
-                    dataset_name,
-                    status_cn,
-                    progress_str,
-                    start_time_str
-                ])
-            
-            return pd.DataFrame(rows, columns=["选择", "任务ID", "数据集名称", "状态", "进度", "开始时间"])
+                view = (sig, tuple(rows))
+                self._tasks_view_cache = (view, generation, active, now)
+                return view
             
         except Exception as e:
             self.logger.error(f'获取下载任务列表失败: {e}')
-            return pd.DataFrame(columns=["选择", "任务ID", "数据集名称", "状态", "进度", "开始时间"])
+            return None, ()
 
 def create_download_tab(launcher):
     manager = DownloadTabManager(launcher)
@@ -1,7 +1,9 @@
 import os
 import json
 import time
+import asyncio
 import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 import gradio as gr
@@ -11,6 +13,14 @@ from ..data_manager import data_manager
 from ..dataset_previewer import DatasetPreviewer
 from ..universal_field_extractor import get_field_names_universal, extract_fields_universal
 
+
+# 字段选择变化后的预览防抖时间（秒），窗口内的连续勾选只渲染最后一次
+FIELD_PREVIEW_DEBOUNCE = 0.3
+
+# 保留最近加载过的数据集预览数量，在几个数据集之间来回切换时无需重新读取
+DATASET_CACHE_SIZE = 8
+
+
 class ManageTabManager:
     def __init__(self, launcher):
         self.launcher = launcher
@@ -20,11 +30,21 @@ class ManageTabManager:
         
         # 缓存当前数据集的数据和字段信息，避免重复读取
         self.current_dataset_cache = {
+            'key': None,
             'path': None,
             'data': None,
             'fields': [],
             'original_preview': None
         }
+        # 最近加载的数据集缓存（LRU），键为 (路径, 修改时间, 大小, 预览行数)，文件变化后自然失效
+        self._dataset_lru: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        
+        # 字段预览请求序号（按会话）：只有防抖结束时仍是该会话最新的请求才渲染
+        self._field_preview_seq: Dict[Optional[str], int] = {}
+        
+        # 数据集列表请求序号（按会话）：筛选/搜索/刷新并发执行时只渲染该会话最新一次的结果
+        self._dataset_list_seq: Dict[Optional[str], int] = {}
+        self._dataset_list_lock = threading.Lock()
         
     def create_tab(self):
         """创建数据管理标签页"""
@@ -76,18 +96,7 @@ class ManageTabManager:
             interactive=False
         )
         
-        # 页面加载时自动刷新列表
-        # 使用 Timer 触发一次，并在回调中关闭 Timer
-        init_refresh_timer = gr.Timer(value=0.5)
-        
-        def _init_refresh():
-            return self._refresh_datasets("全部", ""), gr.Timer(active=False)
-            
-        init_refresh_timer.tick(
-            fn=_init_refresh,
-            inputs=[],
-            outputs=[dataset_list, init_refresh_timer]
-        )
+        # 数据集列表在首次打开本页时加载（由启动器绑定标签页选中事件）
         
         # 数据预览区域 - 改为下方完整区域
         gr.Markdown("### 数据预览")
@@ -207,19 +216,25 @@ class ManageTabManager:
         data_type_filter.change(
             fn=self._filter_datasets,
             inputs=[data_type_filter, dataset_name_search],
-            outputs=[dataset_list]
+            outputs=[dataset_list],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         search_dataset_btn.click(
             fn=self._filter_datasets,
             inputs=[data_type_filter, dataset_name_search],
-            outputs=[dataset_list]
+            outputs=[dataset_list],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         refresh_data_btn.click(
             fn=self._refresh_datasets,
             inputs=[data_type_filter, dataset_name_search],
-            outputs=[dataset_list]
+            outputs=[dataset_list],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         preview_data_btn.click(
@@ -250,9 +265,12 @@ class ManageTabManager:
         
         # 字段选择器变化事件 - 实时更新预览
         field_selector.change(
-            fn=self._update_preview_by_fields,
+            fn=self._update_preview_by_fields_debounced,
             inputs=[field_selector, preview_rows, text_truncation, max_text_length],
-            outputs=[result_display_html, data_status]
+            outputs=[result_display_html, data_status],
+            # 允许新的勾选在上一次仍在等待时立即开始，等待中的旧请求据序号放弃渲染
+            trigger_mode="multiple",
+            concurrency_limit=None
         )
         
         # 字段选择按钮事件
@@ -271,18 +289,26 @@ class ManageTabManager:
             outputs=[field_selector]
         )
 
-    def _filter_datasets(self, data_type: str, search_name: str = "") -> Any:
-        """根据数据类型和名称筛选数据集"""
-        return self._get_datasets_df(data_type, search_name)
+    def _filter_datasets(self, data_type: str, search_name: str = "", request: gr.Request = None) -> Any:
+        """根据数据类型和名称筛选数据集（同一会话已有更新的列表请求时放弃本次结果）"""
+        session = request.session_hash if request is not None else None
+        with self._dataset_list_lock:
+            seq = self._dataset_list_seq.get(session, 0) + 1
+            self._dataset_list_seq[session] = seq
+        
+        df = self._get_datasets_df(data_type, search_name)
+        if self._dataset_list_seq.get(session) != seq:
+            return gr.skip()
+        return df
     
-    def _refresh_datasets(self, data_type: str, search_name: str = "") -> Any:
+    def _refresh_datasets(self, data_type: str, search_name: str = "", request: gr.Request = None) -> Any:
         """刷新数据集列表（优化版本）"""
         try:
             self.logger.info(f"开始刷新数据集列表: 类型={data_type}, 搜索={search_name}")
             
             # 直接在主线程执行，避免线程池带来的上下文问题和潜在的死锁
             # 对于文件系统操作，Python的GIL会释放，所以不会完全阻塞
-            return self._get_datasets_df(data_type, search_name)
+            return self._filter_datasets(data_type, search_name, request)
             
         except Exception as e:
             self.logger.error(f"刷新数据集列表失败: {e}")
@@ -741,13 +767,13 @@ class ManageTabManager:
     
     def _select_dataset_with_auto_preview(self, evt: gr.SelectData, auto_preview: bool, 
                                         preview_rows: int, enable_truncation: bool, 
-                                        max_text_length: int) -> Tuple[str, str, Any, gr.CheckboxGroup, str]:
+                                        max_text_length: int) -> Tuple[str, str, Any, Dict[str, Any], str]:
         """选择数据集并自动预览（新版本，包含字段选择）"""
         try:
             # 获取当前行的所有数据
             row_data = evt.row_value
             if not row_data or len(row_data) < 5:
-                return "", "*请选择有效的数据集*", "", gr.CheckboxGroup(choices=[], value=[]), ""
+                return "", "*请选择有效的数据集*", "", gr.update(choices=[], value=[]), ""
             
             # 提取数据集信息
             dataset_name = row_data[0]
@@ -768,30 +794,27 @@ class ManageTabManager:
 - **创建时间**: {dataset_time}
 - **路径**: `{os.path.basename(dataset_path)}`"""
                 
-                return dataset_path, info_text, "", gr.CheckboxGroup(choices=[], value=[]), "✅ 数据集已选择，等待预览..."
+                return dataset_path, info_text, "", gr.update(choices=[], value=[]), "✅ 数据集已选择，等待预览..."
                 
         except Exception as e:
             self.logger.error(f'选择数据集失败: {e}')
-            return "", f"❌ 选择失败: {str(e)}", "", gr.CheckboxGroup(choices=[], value=[]), ""
+            return "", f"❌ 选择失败: {str(e)}", "", gr.update(choices=[], value=[]), ""
     
     def _load_dataset_with_fields(self, dataset_path: str, preview_rows: int, 
-                                enable_truncation: bool, max_text_length: int) -> Tuple[str, str, Any, gr.CheckboxGroup, str]:
+                                enable_truncation: bool, max_text_length: int) -> Tuple[str, str, Any, Dict[str, Any], str]:
         """加载数据集并分析字段（核心功能）"""
         try:
             if not dataset_path.strip():
-                return "", "*请选择要预览的数据集*", "", gr.CheckboxGroup(choices=[], value=[]), "❌ 请选择要预览的数据集"
+                return "", "*请选择要预览的数据集*", "", gr.update(choices=[], value=[]), "❌ 请选择要预览的数据集"
             
             if not os.path.exists(dataset_path):
-                return "", "*数据集文件不存在*", "", gr.CheckboxGroup(choices=[], value=[]), "❌ 数据集文件不存在"
+                return "", "*数据集文件不存在*", "", gr.update(choices=[], value=[]), "❌ 数据集文件不存在"
             
-            # 检查是否是新的数据集，如果是则清空缓存
-            if self.current_dataset_cache['path'] != dataset_path:
-                self.current_dataset_cache = {
-                    'path': dataset_path,
-                    'data': None,
-                    'fields': [],
-                    'original_preview': None
-                }
+            # 数据集、文件内容或预览行数变化时切换到对应的缓存条目（最近加载过的直接复用）
+            st = os.stat(dataset_path)
+            cache_key = (dataset_path, st.st_mtime_ns, st.st_size, preview_rows)
+            if self.current_dataset_cache['key'] != cache_key:
+                self.current_dataset_cache = self._get_dataset_cache_entry(cache_key)
             
             # 如果缓存中没有数据，则读取数据集
             if self.current_dataset_cache['data'] is None:
@@ -806,10 +829,10 @@ class ManageTabManager:
                 preview_result = self.dataset_previewer.preview_dataset(dataset_path, preview_rows)
                 
                 if not preview_result.success:
-                    return "", "*预览失败*", "", gr.CheckboxGroup(choices=[], value=[]), f"❌ 预览失败: {preview_result.error_message}"
+                    return "", "*预览失败*", "", gr.update(choices=[], value=[]), f"❌ 预览失败: {preview_result.error_message}"
                 
                 if not preview_result.data:
-                    return "", "*数据集为空*", "", gr.CheckboxGroup(choices=[], value=[]), "❌ 数据集为空"
+                    return "", "*数据集为空*", "", gr.update(choices=[], value=[]), "❌ 数据集为空"
                 
                 # 缓存数据
                 self.current_dataset_cache['data'] = preview_result.data
@@ -842,13 +865,11 @@ class ManageTabManager:
             # 识别常用字段并设为默认选中
             common_fields = self._identify_common_fields(available_fields)
             
-            # 创建字段选择器
+            # 更新字段选择器（只下发选项与选中值，不重建组件）
             field_choices = [(field, field) for field in available_fields]
-            field_selector = gr.CheckboxGroup(
-                label="可用字段",
+            field_selector = gr.update(
                 choices=field_choices,
                 value=common_fields,  # 默认选中常用字段
-                interactive=True,
                 info=f"数据集包含 {len(available_fields)} 个字段，已默认选中常用字段"
             )
             
@@ -870,7 +891,15 @@ class ManageTabManager:
         except Exception as e:
             self.logger.error(f'加载数据集和字段失败: {e}')
             error_msg = f"❌ 加载失败: {str(e)}"
-            return "", "*加载失败*", "", gr.CheckboxGroup(choices=[], value=[]), error_msg
+            return "", "*加载失败*", "", gr.update(choices=[], value=[]), error_msg
+    
+    def _get_simple_field_names(self, dataset_path: str) -> List[str]:
+        """获取数据集字段名（含嵌套字段路径）
+        
+        单个文件的检测结果由 universal_field_extractor 按 (路径, 修改时间, 大小) 缓存，
+        同一文件重复预览不再重新解析；目录每次重新检测。
+        """
+        return get_field_names_universal(dataset_path)
     
     def _identify_common_fields(self, available_fields: List[str]) -> List[str]:
         """识别常用字段"""
@@ -913,40 +942,44 @@ class ManageTabManager:
             if not selected_fields:
                 return pd.DataFrame(), "❌ 请选择至少一个字段"
             
-            # 从缓存的完整数据中过滤字段
-            filtered_data = []
-            for row in self.current_dataset_cache['data']:
-                filtered_row = {}
-                for field in selected_fields:
-                    # 检查是否是嵌套字段路径
-                    if '.' in field or '[' in field:
-                        # 使用universal_field_extractor的方法提取嵌套值
+            # 从缓存的完整数据中按列过滤字段
+            rows = self.current_dataset_cache['data']
+            columns = {}
+            for field in selected_fields:
+                # 检查是否是嵌套字段路径
+                if '.' in field or '[' in field:
+                    # 使用universal_field_extractor的方法提取嵌套值
+                    values = []
+                    for row in rows:
                         try:
                             from ..universal_field_extractor import _extractor
-                            value = _extractor._get_nested_value(row, field)
+                            values.append(_extractor._get_nested_value(row, field))
                         except:
-                            value = None
-                    else:
-                        # 简单字段直接获取
-                        value = row.get(field)
-                    
-                    # 处理None值
-                    if value is None:
-                        filtered_row[field] = ""
-                    else:
-                        # 应用文本截断
-                        if enable_truncation and isinstance(value, str) and len(value) > max_text_length:
-                            value = value[:max_text_length] + "..."
-                        # 确保值可以被pandas处理
-                        if isinstance(value, (list, dict)):
-                            filtered_row[field] = str(value)
-                        else:
-                            filtered_row[field] = value
-                    
-                filtered_data.append(filtered_row)
+                            values.append(None)
+                else:
+                    # 简单字段直接获取
+                    values = [row.get(field) for row in rows]
+                
+                # 处理None值
+                column = pd.Series(["" if value is None else value for value in values], dtype=object)
+                if pd.api.types.infer_dtype(column, skipna=True) == 'string':
+                    # 纯文本列：由 pandas 的字符串方法整列截断
+                    if enable_truncation:
+                        column = column.where(
+                            column.str.len() <= max_text_length,
+                            column.str.slice(0, max_text_length) + "..."
+                        )
+                else:
+                    # 混合类型列：逐个处理，仅截断字符串，并确保值可以被pandas处理
+                    column = column.map(
+                        lambda value: value[:max_text_length] + "..."
+                        if enable_truncation and isinstance(value, str) and len(value) > max_text_length
+                        else (str(value) if isinstance(value, (list, dict)) else value)
+                    )
+                columns[field] = column
             
             # 转换为DataFrame
-            df = pd.DataFrame(filtered_data)
+            df = pd.DataFrame(columns)
             
             # 构建状态信息
             preview_result = self.current_dataset_cache['original_preview']
@@ -956,7 +989,7 @@ class ManageTabManager:
                 f"📊 总字段数: {len(self.current_dataset_cache['fields'])}",
                 f"👁️ 显示字段数: {len(selected_fields)}",
                 f"📈 总行数: {preview_result.total_rows:,}",
-                f"👀 预览行数: {len(filtered_data)}",
+                f"👀 预览行数: {len(rows)}",
                 f"📋 选中字段: {', '.join(selected_fields)}"
             ]
             
@@ -1015,6 +1048,24 @@ class ManageTabManager:
             self.logger.error(f'生成数据集信息失败: {e}')
             return f"*数据集信息生成失败: {str(e)}*"
 
+    def _get_dataset_cache_entry(self, cache_key: tuple) -> Dict[str, Any]:
+        """按键取出（或新建）数据集缓存条目，并维护 LRU 顺序与容量"""
+        entry = self._dataset_lru.get(cache_key)
+        if entry is not None:
+            self._dataset_lru.move_to_end(cache_key)
+            return entry
+        entry = {
+            'key': cache_key,
+            'path': cache_key[0],
+            'data': None,
+            'fields': [],
+            'original_preview': None
+        }
+        self._dataset_lru[cache_key] = entry
+        while len(self._dataset_lru) > DATASET_CACHE_SIZE:
+            self._dataset_lru.popitem(last=False)
+        return entry
+
     def _preview_dataset_with_field_filter(self, dataset_path: str, preview_rows: int,
                                          enable_truncation: bool, max_text_length: int,
                                          selected_fields: List[str]) -> Tuple[str, str]:
@@ -1054,11 +1105,7 @@ class ManageTabManager:
             if not dataset_path or not dataset_path.strip():
                 return "", "💡 请先选择数据集"
             
-            # 强制重新加载数据（因为行数变了，缓存的数据可能不够）
-            # 清空当前缓存的数据，迫使 _load_dataset_with_fields 重新读取
-            self.current_dataset_cache['data'] = None
-            
-            # 重新加载并应用字段过滤
+            # 重新加载并应用字段过滤（缓存键包含预览行数，行数变化时按新行数读取或复用此前的缓存）
             _, _, preview_df, _, status_msg = self._load_dataset_with_fields(
                 dataset_path, preview_rows, enable_truncation, max_text_length
             )
@@ -1105,6 +1152,29 @@ class ManageTabManager:
             self.logger.error(f'更新字段预览失败: {e}')
             return "", f"❌ 更新失败: {str(e)}"
 
+    async def _update_preview_by_fields_debounced(self, selected_fields: List[str],
+                                                  preview_rows: int, enable_truncation: bool,
+                                                  max_text_length: int,
+                                                  request: gr.Request = None) -> Tuple[Any, Any]:
+        """字段选择变化的防抖包装：等待 FIELD_PREVIEW_DEBOUNCE 秒本会话无新变化后再渲染预览"""
+        session = request.session_hash if request is not None else None
+        # 读写都在事件循环线程内完成，无需加锁
+        seq = self._field_preview_seq.get(session, 0) + 1
+        self._field_preview_seq[session] = seq
+        await asyncio.sleep(FIELD_PREVIEW_DEBOUNCE)
+        if seq != self._field_preview_seq.get(session):
+            return gr.skip(), gr.skip()
+        
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self.launcher.io_pool, self._update_preview_by_fields,
+            selected_fields, preview_rows, enable_truncation, max_text_length
+        )
+        # 渲染期间又有新的勾选时，丢弃这次已过期的结果
+        if seq != self._field_preview_seq.get(session):
+            return gr.skip(), gr.skip()
+        return result
+
     def _select_all_dataset_fields(self) -> Dict[str, Any]:
         """全选所有字段"""
         try:
@@ -1,8 +1,21 @@
+import asyncio
 import gradio as gr
 from typing import Dict, Any, Tuple, List
 from ..dependencies import pd
 from ..model_manager import model_manager
 
+
+# “测试所有模型”时同时进行的连接测试数量上限，避免占满共享线程池或同时压向同一服务
+MODEL_TEST_CONCURRENCY = 16
+
+# 模型列表中的状态显示
+MODEL_STATUS_LABELS = {
+    'online': "✅ 正常",
+    'offline': "❌ 离线",
+    'error': "⚠️ 错误"
+}
+
+
 class ModelTabManager:
     def __init__(self, launcher):
         self.launcher = launcher
@@ -95,8 +108,8 @@ class ModelTabManager:
                 show_copy_button=True
             )
         
-        # 自动刷新定时器
-        auto_refresh_timer = gr.Timer(value=2)
+        # 自动刷新定时器（仅在本页选中时由启动器开启）
+        auto_refresh_timer = gr.Timer(value=2, active=False)
         auto_refresh_timer.tick(
             fn=self._get_models_df,
             outputs=[model_list]
@@ -141,13 +154,16 @@ class ModelTabManager:
         
         refresh_model_btn.click(
             fn=self._refresh_models,
-            outputs=[model_list]
+            outputs=[model_list],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         # 模型列表点击事件
         model_list.select(
             fn=self._select_model,
-            outputs=[selected_model_name]
+            outputs=[selected_model_name],
+            queue=False
         )
 
     def _add_model(self, name: str, model_type: str, url: str, 
@@ -191,8 +207,8 @@ class ModelTabManager:
             self.logger.error(f'添加模型失败: {e}')
             return f"❌ 添加失败: {str(e)}", self._get_models_df()
     
-    def _test_all_models(self) -> Tuple[str, Any]:
-        """测试所有模型（包含离线/未知状态）"""
+    async def _test_all_models(self) -> Tuple[str, Any]:
+        """测试所有模型（包含离线/未知状态），各模型的连接测试并发执行"""
         try:
             # 获取全部模型（名称 -> 配置）
             all_models = model_manager.get_all_models()
@@ -200,18 +216,27 @@ class ModelTabManager:
             if not names:
                 return "❌ 没有已注册的模型", self._get_models_df()
 
+            # 连接测试是阻塞的网络请求，放到线程池并发执行（限制并发数），总耗时取决于最慢的模型
+            loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(MODEL_TEST_CONCURRENCY)
+
+            async def _test_one(model_name: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await loop.run_in_executor(self.launcher.io_pool, model_manager.test_model, model_name)
+
+            outcomes = await asyncio.gather(*(_test_one(name) for name in names), return_exceptions=True)
+
             results = []
-            for model_name in names:
-                try:
-                    result = model_manager.test_model(model_name)
-                    if result.get('success'):
-                        rt = result.get('response_time', 0)
-                        status = f"✅ 正常 ({rt:.2f}ms)"
-                    else:
-                        status = f"❌ 失败: {result.get('error_msg') or result.get('error', 'Unknown error')}"
-                    results.append(f"模型 {model_name}: {status}")
-                except Exception as e:
-                    results.append(f"模型 {model_name}: ❌ 异常: {str(e)}")
+            for model_name, result in zip(names, outcomes):
+                if isinstance(result, Exception):
+                    results.append(f"模型 {model_name}: ❌ 异常: {str(result)}")
+                    continue
+                if result.get('success'):
+                    rt = result.get('response_time', 0)
+                    status = f"✅ 正常 ({rt:.2f}ms)"
+                else:
+                    status = f"❌ 失败: {result.get('error_msg') or result.get('error', 'Unknown error')}"
+                results.append(f"模型 {model_name}: {status}")
 
             return f"🔧 测试完成:\n" + "\n".join(results), self._get_models_df()
 
@@ -255,8 +280,8 @@ class ModelTabManager:
             self.logger.error(f'删除模型失败: {e}')
             return f"❌ 删除失败: {str(e)}", self._get_models_df()
     
-    def _refresh_models(self) -> Any:
-        """刷新模型列表"""
+    async def _refresh_models(self) -> Any:
+        """刷新模型列表（只读内存中的模型配置，直接在事件循环中执行）"""
         return self._get_models_df()
     
     def _select_model(self, evt: gr.SelectData) -> str:
@@ -274,38 +299,19 @@ class ModelTabManager:
             if not all_models:
                 return pd.DataFrame(columns=["模型名称", "类型", "状态", "URL", "响应时间", "操作"])
 
-            # 构建数据框（使用已记录的 status/response_time）
-            rows = []
-            for name, cfg in all_models.items():
-                model_type = (cfg.get('type') or '').upper()
-                url = cfg.get('url', '')
-                status_val = cfg.get('status', 'unknown')
-                rt_ms = cfg.get('response_time', 0)
-
-                if status_val == 'online':
-                    status = "✅ 正常"
-                elif status_val == 'offline':
-                    status = "❌ 离线"
-                elif status_val == 'error':
-                    status = "⚠️ 错误"
-                else:
-                    status = "❓ 未知"
-
+            # 按列构建数据框（使用已记录的 status/response_time）
+            configs = list(all_models.values())
+            urls = [cfg.get('url', '') for cfg in configs]
+            response_times = [cfg.get('response_time', 0) for cfg in configs]
+            return pd.DataFrame({
+                "模型名称": list(all_models.keys()),
+                "类型": [(cfg.get('type') or '').upper() for cfg in configs],
+                "状态": [MODEL_STATUS_LABELS.get(cfg.get('status', 'unknown'), "❓ 未知") for cfg in configs],
+                "URL": [url[:50] + "..." if len(url) > 50 else url for url in urls],
                 # 展示为毫秒，避免误解为秒
-                response_time = f"{rt_ms:.2f}ms" if rt_ms else "-"
-
-                display_url = url[:50] + "..." if len(url) > 50 else url
-
-                rows.append([
-                    name,
-                    model_type,
-                    status,
-                    display_url,
-                    response_time,
-                    "点击选择"
-                ])
-
-            return pd.DataFrame(rows, columns=["模型名称", "类型", "状态", "URL", "响应时间", "操作"])
+                "响应时间": [f"{rt_ms:.2f}ms" if rt_ms else "-" for rt_ms in response_times],
+                "操作": ["点击选择"] * len(configs)
+            })
             
         except Exception as e:
             self.logger.error(f'获取模型列表失败: {e}')
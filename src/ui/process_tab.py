@@ -1,15 +1,79 @@
 import os
 import time
+import asyncio
+import threading
+import functools
+import atexit
 from datetime import datetime
 import re
 import json
-from pathlib import Path
 import gradio as gr
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Optional
 from ..dependencies import pd
 from ..data_cleaner import data_cleaner
 from ..universal_field_extractor import get_field_names_universal, extract_fields_universal
 
+
+# 待合并文件列表的列
+MERGE_FILE_COLUMNS = ["文件名", "路径", "大小"]
+
+# 进度消息中的计数部分（如 "1,234/5,000"），去掉后用于区分阶段消息与同一阶段的计数消息
+_PROGRESS_COUNT_RE = re.compile(r'[\d,]+')
+
+# 界面状态写入配置的防抖间隔（秒）
+CFG_FLUSH_DELAY = 0.5
+
+# “敏感词规则说明”折叠面板的 Markdown 文本（模块级常量，构建界面时不再重复创建）
+SENSITIVE_RULES_HELP_MD = """
+**匹配模式说明**
+
+1. 普通模式：按提供的词条逐一精确子串匹配（默认忽略大小写，除非勾选大小写敏感）。
+2. 正则模式：勾选“敏感词使用正则模式”后，列表中每一项视为一个正则表达式，支持分组与量词。
+3. 字段白名单 / 排除：
+   - “敏感词扫描字段”填写后，仅这些字段会被检测。
+   - “敏感词排除字段”优先生效，可排除部分字段。
+4. 字段级策略优先级：字段策略 > 全局动作。格式: `字段:动作[:替换]`；动作支持 `drop_record|remove_word|replace_word`。
+5. 统计信息：清洗完成后报告中 `sensitive_detail.field_hits` 记录各字段命中次数，`word_hits` 记录各词命中次数。`unused_parameters` 可帮助确认未生效的多余参数。
+6. Drop Record 提前：一旦某字段策略或全局动作触发 `drop_record` 且匹配命中，该记录立即丢弃，不再继续替换其它字段。
+
+**示例**
+```
+敏感词列表: 密钥,密码
+字段级策略: instruction:remove_word,note:replace_word:[SENSITIVE]
+```
+表示 instruction 删除词本身，note 用 [SENSITIVE] 替换。
+"""
+
+# “文本标准化说明”折叠面板的 Markdown 文本
+NORMALIZE_MODES_HELP_MD = """
+**各选项含义与场景**
+
+1. `unicode_nfc` 统一等价字符的内部表示（NFC 规范化）。
+    - 解决：同样显示的字符因为分解/组合形式不同导致匹配/去重失败。
+    - 例：`e + ́` -> `é`。
+
+2. `fullwidth` 全角转半角（只作用于字母 / 数字 / 常见英文标点）。
+    - 解决：输入法全角模式 / 网页复制导致的ＡＢＣ１２３，避免匹配失败。
+    - 例：`ＡＢＣ１２３，．／` -> `ABC123,./`。
+
+3. `lowercase` 所有字母转小写。
+    - 适合：后续匹配/去重不关心大小写（如英文普通描述、标签）。
+    - 不推荐：区分大小写有意义（专有名词、代码片段、变量、情感强调）。
+
+4. `collapse_newlines` 折叠多余空行，避免大段空白。
+    - 处理：将连续的空行收缩为 1 行，并清理多余空白；可减少 token / 噪声。
+    - 保留：正常段落的单个换行。
+
+**执行顺序（当前实现）** 先做空白折叠，再按所选模式应用（NFC → 全角 → 小写 → 空行折叠）。
+如需更精细顺序或增加“保留大小写重要字段”白名单，可后续扩展。
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def _canonical_path(path: str) -> str:
+    """解析符号链接、.. 与尾部分隔符后的规范路径（缓存，避免重复解析）"""
+    return os.path.realpath(path)
+
 class ProcessTabManager:
     def __init__(self, launcher):
         self.launcher = launcher
@@ -19,8 +83,44 @@ class ProcessTabManager:
         self.data_merger = launcher.data_merger
         self.data_cleaner = data_cleaner
         
-        # 新增：合并文件路径列表
-        self.merge_file_paths = []
+        # 新增：待合并文件行 (文件名, 路径, 大小)，与界面列表逐行对应，界面表格直接由其生成
+        # Gradio 队列会并发执行处理函数，修改一律在锁内以写时复制方式替换为新元组，
+        # 读取方直接引用当前元组作为快照，无需持锁
+        self.merge_files: Tuple[Tuple[str, str, str], ...] = ()
+        self._merge_lock = threading.Lock()
+        
+        # 上传文件的 stat 缓存（Gradio 临时文件上传后内容不变）
+        self._stat_cache: Dict[str, os.stat_result] = {}
+        self._stat_cache_lock = threading.Lock()
+        
+        # 最近一次构建的任务列表: (任务变更代数, 签名, DataFrame)
+        self._convert_df_cache: Optional[Tuple[int, Any, pd.DataFrame]] = None
+        
+        # 界面状态持久化：连续修改（如逐字输入）合并后统一写入配置文件
+        self._pending_cfg: Dict[str, Any] = {}
+        self._cfg_lock = threading.Lock()
+        self._cfg_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_cfg_updates)
+
+    def _defer_cfg_update(self, key: str, value: Any):
+        """记录界面状态修改，空闲 CFG_FLUSH_DELAY 秒后批量写入配置"""
+        with self._cfg_lock:
+            self._pending_cfg[key] = value
+            if self._cfg_timer is not None:
+                self._cfg_timer.cancel()
+            self._cfg_timer = threading.Timer(CFG_FLUSH_DELAY, self._flush_cfg_updates)
+            self._cfg_timer.daemon = True
+            self._cfg_timer.start()
+
+    def _flush_cfg_updates(self):
+        """将待写入的界面状态一次性落盘（定时器到期或进程退出时调用）"""
+        with self._cfg_lock:
+            pending, self._pending_cfg = self._pending_cfg, {}
+            if self._cfg_timer is not None:
+                self._cfg_timer.cancel()
+                self._cfg_timer = None
+        for key, value in pending.items():
+            self.launcher.config_manager.update_config(key, value)
 
     def _start_format_convert(self, source_file, target_format: str, output_dir: str) -> str:
         """开始格式转换"""
@@ -56,50 +156,87 @@ class ProcessTabManager:
 
     def _get_convert_tasks_df(self) -> pd.DataFrame:
         """获取转换任务列表"""
+        return self._get_convert_tasks_view()[1]
+
+    def _get_convert_tasks_view(self) -> Tuple[Any, pd.DataFrame]:
+        """获取转换任务列表及其签名
+
+        转换器的任务变更代数未变时不再扫描任务；代数变化但签名 (ID, 状态, 进度)
+        与上次相同时仍复用缓存的 DataFrame。
+        """
         try:
+            # 先读代数再取任务，期间发生的变化会让下次调用重新扫描
+            generation = self.format_converter.get_task_generation()
+            cached = self._convert_df_cache
+            if cached is not None and cached[0] == generation:
+                return cached[1], cached[2]
             tasks = self.format_converter.list_tasks()
+            sig = tuple((t.get('task_id'), t.get('status'), t.get('progress')) for t in tasks)
+            if cached is not None and cached[1] == sig:
+                self._convert_df_cache = (generation, sig, cached[2])
+                return sig, cached[2]
             if not tasks:
-                return pd.DataFrame(columns=["任务ID", "源文件", "目标格式", "状态", "进度", "输出文件"])
+                df = pd.DataFrame(columns=["任务ID", "源文件", "目标格式", "状态", "进度", "输出文件"])
+                self._convert_df_cache = (generation, sig, df)
+                return sig, df
             
-            task_data = []
-            for task in tasks:
-                task_id = task.get('task_id', 'N/A')
-                source_path = task.get('source_path', '')
-                source_file = os.path.basename(source_path) if source_path else 'N/A'
-                target_format = task.get('target_format', 'N/A').upper()
-                status = task.get('status', 'unknown')
-                progress = f"{task.get('progress', 0)}%"
-                
-                # 生成输出文件名
-                if status == 'completed':
-                    source_stem = Path(source_path).stem if source_path else 'unknown'
-                    source_ext = Path(source_path).suffix.replace('.', '') if source_path else ''
-                    target_ext = 'md' if target_format.lower() == 'markdown' else target_format.lower()
-                    output_filename = f"{source_stem}_{source_ext}2{target_ext}.{target_ext}"
-                else:
-                    output_filename = "转换中..."
-                
-                task_data.append([
-                    task_id[:15] + "..." if len(task_id) > 15 else task_id,
-                    source_file,
-                    target_format,
-                    status,
-                    progress,
-                    output_filename
-                ])
+            # 一次性取出原始字段，再按列做字符串处理（object 列保留进度的原始数值写法）
+            raw = pd.DataFrame(
+                [(t.get('task_id', 'N/A'), t.get('source_path', ''), t.get('target_format', 'N/A'),
+                  t.get('status', 'unknown'), t.get('progress', 0)) for t in tasks],
+                columns=['task_id', 'source_path', 'target_format', 'status', 'progress'],
+                dtype=object
+            )
+            task_ids = raw['task_id']
+            has_source = raw['source_path'].astype(bool)
+            basenames = raw['source_path'].where(has_source, '').map(os.path.basename)
+            target_format = raw['target_format'].str.upper()
             
-            return pd.DataFrame(task_data, columns=["任务ID", "源文件", "目标格式", "状态", "进度", "输出文件"])
+            # 生成输出文件名：<源文件名>_<源扩展名>2<目标扩展名>.<目标扩展名>，未完成的任务显示“转换中...”
+            split_names = basenames.map(os.path.splitext)
+            source_stems = split_names.str[0].where(has_source, 'unknown')
+            source_exts = split_names.str[1].str.replace('.', '', regex=False)
+            target_exts = target_format.str.lower().replace('markdown', 'md')
+            output_filenames = (source_stems + '_' + source_exts + '2' + target_exts + '.' + target_exts) \
+                .where(raw['status'] == 'completed', "转换中...")
+            
+            df = pd.DataFrame({
+                "任务ID": task_ids.where(task_ids.str.len() <= 15, task_ids.str.slice(0, 15) + "..."),
+                "源文件": basenames.where(has_source, 'N/A'),
+                "目标格式": target_format,
+                "状态": raw['status'],
+                "进度": raw['progress'].astype(str) + "%",
+                "输出文件": output_filenames
+            })
+            self._convert_df_cache = (generation, sig, df)
+            return sig, df
             
         except Exception as e:
             self.logger.error(f'获取转换任务列表失败: {e}')
-            return pd.DataFrame(columns=["任务ID", "源文件", "目标格式", "状态", "进度", "输出文件"])
+            return None, pd.DataFrame(columns=["任务ID", "源文件", "目标格式", "状态", "进度", "输出文件"])
+
+    def _tick_convert_tasks(self, last_sig):
+        """定时刷新转换任务列表：任务未变化（代数不变或签名与本会话上次渲染相同）时不推送"""
+        sig, df = self._get_convert_tasks_view()
+        if sig is not None and sig == last_sig:
+            return gr.skip(), gr.skip()
+        return df, sig
 
     def _select_convert_task(self, evt: gr.SelectData) -> str:
         """选择转换任务"""
         try:
             row_data = evt.row_value
             if row_data and len(row_data) >= 1:
-                return row_data[0]  # 返回任务ID
+                shown_id = str(row_data[0])
+                # 列表中的ID被截断后可能不唯一（同一小时内创建的任务前缀相同），
+                # 按行号从缓存签名中取完整ID，查看详情时即可精确查找
+                cached = self._convert_df_cache
+                row = evt.index[0] if isinstance(evt.index, (list, tuple)) else evt.index
+                if cached is not None and isinstance(row, int) and 0 <= row < len(cached[1]):
+                    full_id = cached[1][row][0]
+                    if full_id and str(full_id).startswith(shown_id.replace('...', '')):
+                        return full_id
+                return shown_id  # 返回任务ID
             return ""
         except Exception as e:
             self.logger.error(f'选择转换任务失败: {e}')
@@ -111,20 +248,11 @@ class ProcessTabManager:
             if not task_id.strip():
                 return "❌ 请选择要查看的任务"
             
-            # 获取完整任务ID（如果被截断）
-            tasks = self.format_converter.list_tasks()
-            full_task_id = None
-            for task in tasks:
-                if task.get('task_id', '').startswith(task_id.replace('...', '')):
-                    full_task_id = task.get('task_id')
-                    break
-            
-            if not full_task_id:
-                return "❌ 任务不存在"
-                
-            task = self.format_converter.get_task_progress(full_task_id)
+            # 按（可能被截断的）任务ID前缀查找任务
+            task = self.format_converter.find_task(task_id.replace('...', ''))
             if not task:
-                return "❌ 无法获取任务信息"
+                return "❌ 任务不存在"
+            full_task_id = task.get('task_id')
                 
             info = [
                 f"任务ID: {full_task_id}",
@@ -143,19 +271,19 @@ class ProcessTabManager:
             self.logger.error(f'查看转换结果失败: {e}')
             return f"❌ 查看结果失败: {str(e)}"
 
-    def _preview_extract_fields(self, file_obj) -> gr.CheckboxGroup:
-        """获取文件字段列表"""
+    def _preview_extract_fields(self, file_obj) -> Dict[str, Any]:
+        """获取文件字段列表（字段检测结果按文件缓存；只下发选项与选中值，不重建组件）"""
         try:
             if file_obj is None:
-                return gr.CheckboxGroup(choices=[], value=[])
+                return gr.update(choices=[], value=[])
             
             file_path = file_obj.name
             fields = get_field_names_universal(file_path)
             
-            return gr.CheckboxGroup(choices=fields, value=[])
+            return gr.update(choices=fields, value=[])
         except Exception as e:
             self.logger.error(f'获取字段失败: {e}')
-            return gr.CheckboxGroup(choices=[], value=[])
+            return gr.update(choices=[], value=[])
 
     def _reset_field_selection(self):
         """重置字段选择"""
@@ -170,6 +298,27 @@ class ProcessTabManager:
         df = pd.DataFrame(data, columns=["原字段", "新字段"])
         return gr.update(value=df, visible=True)
 
+    def _stat_path(self, path: str, use_cache: bool = False) -> Optional[os.stat_result]:
+        """单次 os.stat 同时完成存在性检查与大小获取，文件不存在时返回 None
+
+        use_cache 仅用于上传的临时文件；输出文件等可能变化的路径不应缓存。
+        """
+        if use_cache:
+            with self._stat_cache_lock:
+                st = self._stat_cache.get(path)
+            if st is not None:
+                return st
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if use_cache:
+            with self._stat_cache_lock:
+                if len(self._stat_cache) >= 256:
+                    self._stat_cache.clear()
+                self._stat_cache[path] = st
+        return st
+
     def _start_field_extract(self, source_file, fields: List[str], output_dir: str) -> str:
         """开始字段提取"""
         try:
@@ -180,7 +329,7 @@ class ProcessTabManager:
                 return "❌ 请选择要提取的字段"
 
             source_path = source_file.name
-            if not os.path.exists(source_path):
+            if self._stat_path(source_path, use_cache=True) is None:
                 return "❌ 源文件不存在"
 
             # 使用通用字段提取器
@@ -191,8 +340,9 @@ class ProcessTabManager:
                 output_dir=output_dir or str(self.launcher.root_dir / 'processed')
             )
 
-            if result_path and os.path.exists(result_path):
-                file_size = os.path.getsize(result_path)
+            result_stat = self._stat_path(result_path) if result_path else None
+            if result_stat is not None:
+                file_size = result_stat.st_size
                 return f"✅ 字段提取完成！\n提取字段: {', '.join(fields)}\n输出文件: {result_path}\n文件大小: {file_size:,} 字节"
             else:
                 return "❌ 字段提取失败"
@@ -201,6 +351,11 @@ class ProcessTabManager:
             self.logger.error(f'字段提取失败: {e}')
             return f"❌ 字段提取失败: {str(e)}"
     
+    @property
+    def merge_file_paths(self) -> Tuple[str, ...]:
+        """待合并文件路径（当前快照）"""
+        return tuple(row[1] for row in self.merge_files)
+
     def _add_merge_file(self, file_obj, current_data) -> Tuple[None, Any]:
         """添加合并文件"""
         try:
@@ -209,64 +364,53 @@ class ProcessTabManager:
             
             file_path = file_obj.name
             
-            # 允许添加重复文件（支持不同目录同名文件，或有意重复合并）
-            # if file_path in self.merge_file_paths:
-            #     return None, current_data
-                
-            self.merge_file_paths.append(file_path)
-            
-            # 获取文件信息
+            # 获取文件信息（先于入列，文件不可访问时不留下孤立路径）
+            file_stat = self._stat_path(file_path, use_cache=True)
+            if file_stat is None:
+                raise FileNotFoundError(file_path)
             file_name = os.path.basename(file_path)
-            file_size = self._format_size(os.path.getsize(file_path))
+            file_size = self._format_size(file_stat.st_size)
             
-            # 更新DataFrame
-            new_row = [file_name, file_path, file_size]
+            # 允许添加重复文件（支持不同目录同名文件，或有意重复合并）
+            with self._merge_lock:
+                files = self.merge_files = self.merge_files + ((file_name, file_path, file_size),)
             
-            if isinstance(current_data, pd.DataFrame):
-                # 如果是DataFrame，添加新行
-                new_df = pd.concat([current_data, pd.DataFrame([new_row], columns=["文件名", "路径", "大小"])], ignore_index=True)
-                return None, new_df
-            else:
-                # 如果是列表（初始状态），创建新DataFrame
-                if not current_data:
-                    return None, pd.DataFrame([new_row], columns=["文件名", "路径", "大小"])
-                else:
-                    # 尝试转换现有数据
-                    try:
-                        df = pd.DataFrame(current_data, columns=["文件名", "路径", "大小"])
-                        new_df = pd.concat([df, pd.DataFrame([new_row], columns=["文件名", "路径", "大小"])], ignore_index=True)
-                        return None, new_df
-                    except:
-                        return None, pd.DataFrame([new_row], columns=["文件名", "路径", "大小"])
+            return None, self._rows_to_df(files)
                         
         except Exception as e:
             self.logger.error(f'添加合并文件失败: {e}')
             return None, current_data
 
+    @staticmethod
+    def _rows_to_df(rows) -> pd.DataFrame:
+        """行序列转换为待合并文件列表 DataFrame"""
+        return pd.DataFrame(list(rows), columns=MERGE_FILE_COLUMNS)
+
+    def _remove_merge_file_at(self, idx: int) -> Optional[Tuple[Tuple[str, str, str], ...]]:
+        """按行号移除待合并文件，返回移除后的快照；行号越界时返回 None"""
+        with self._merge_lock:
+            files = self.merge_files
+            if not 0 <= idx < len(files):
+                return None
+            files = self.merge_files = files[:idx] + files[idx + 1:]
+        return files
+
     def _delete_merge_file(self, evt: gr.SelectData, current_data) -> Any:
         """删除选中的合并文件"""
         try:
-            if not current_data.empty and evt.index[0] < len(current_data):
-                # 获取要删除的文件路径
-                row_index = evt.index[0]
-                file_path = current_data.iloc[row_index]["路径"]
-                
-                # 从列表中移除
-                if file_path in self.merge_file_paths:
-                    self.merge_file_paths.remove(file_path)
-                
-                # 从DataFrame中移除
-                new_df = current_data.drop(row_index).reset_index(drop=True)
-                return new_df
-            return current_data
+            files = self._remove_merge_file_at(evt.index[0])
+            if files is None:
+                return current_data
+            return self._rows_to_df(files)
         except Exception as e:
             self.logger.error(f'删除合并文件失败: {e}')
             return current_data
 
     def _clear_merge_files(self) -> Any:
         """清空合并文件列表"""
-        self.merge_file_paths = []
-        return pd.DataFrame(columns=["文件名", "路径", "大小"])
+        with self._merge_lock:
+            self.merge_files = ()
+        return self._rows_to_df(())
 
     def _format_size(self, size_bytes: int) -> str:
         """格式化文件大小"""
@@ -279,15 +423,30 @@ class ProcessTabManager:
     def _start_merge(self, output_filename: str, output_dir: str, merge_mode: str = "merge") -> str:
         """开始合并任务"""
         try:
-            if not self.merge_file_paths:
+            # 取当前快照，后续并发的增删不影响本次合并
+            input_paths = list(self.merge_file_paths)
+            
+            if not input_paths:
                 return "❌ 请先添加要合并的文件"
             
-            if len(self.merge_file_paths) < 2:
+            if len(input_paths) < 2:
                 return "❌ 至少需要两个文件才能合并"
             
             if not output_filename:
                 return "❌ 请输入输出文件名"
             
+            # 按规范路径分组，检测实际指向同一文件的重复条目
+            path_groups: Dict[str, List[int]] = {}
+            for idx, path in enumerate(input_paths):
+                path_groups.setdefault(_canonical_path(path), []).append(idx)
+            duplicate_groups = {p: idxs for p, idxs in path_groups.items() if len(idxs) > 1}
+            duplicate_note = ""
+            if duplicate_groups and merge_mode == "merge":
+                # 允许有意重复合并，但均衡打散模式下重复读取同一文件通常不是预期行为
+                for path, idxs in duplicate_groups.items():
+                    self.logger.warning(f'合并列表中第 {[i + 1 for i in idxs]} 项指向同一文件: {path}')
+                duplicate_note = f"\n⚠️ 有 {len(duplicate_groups)} 个文件被重复添加，将按重复次数读取"
+            
             # 生成任务ID和时间戳
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
             task_id = f"merge_{int(time.time())}"
@@ -307,7 +466,7 @@ class ProcessTabManager:
             # 构造参数
             params = {
                 "task_id": task_id,
-                "input_paths": self.merge_file_paths,
+                "input_paths": input_paths,
                 "merge_mode": merge_mode,
                 "target_path": target_path,
                 "dedup_field": None,
@@ -318,7 +477,7 @@ class ProcessTabManager:
             result_path = self.data_merger.merge_datasets(params)
             
             if result_path:
-                return f"✅ 合并成功！\n输出文件: {result_path}"
+                return f"✅ 合并成功！\n输出文件: {result_path}{duplicate_note}"
             else:
                 return "❌ 合并失败"
                 
@@ -368,20 +527,8 @@ class ProcessTabManager:
                 if sensitive_exclude_fields and sensitive_exclude_fields.strip():
                     params['sensitive_exclude_fields'] = [f.strip() for f in sensitive_exclude_fields.split(',') if f.strip()]
                 if sensitive_field_policies and sensitive_field_policies.strip():
-                    mapping = {}
-                    for seg in sensitive_field_policies.split(','):
-                        seg = seg.strip()
-                        if not seg:
-                            continue
-                        parts = seg.split(':')
-                        if len(parts) >= 2:
-                            field = parts[0].strip()
-                            act = parts[1].strip()
-                            repl = None
-                            if len(parts) >= 3:
-                                repl = ':'.join(parts[2:]).strip()
-                            if field:
-                                mapping[field] = (act, repl)
+                    # 在此一次性解析为 字段 -> (动作, 替换文本)，清洗时逐条记录直接查表
+                    mapping = self.data_cleaner.parse_field_policies(sensitive_field_policies)
                     if mapping:
                         params['sensitive_field_policies_parsed'] = mapping
                         params['sensitive_field_policies'] = sensitive_field_policies
@@ -412,8 +559,8 @@ class ProcessTabManager:
                 params['normalize_modes'] = normalize_modes
 
             # 调用清洗器
-            cleaner = self.data_cleaner.DataCleaner()
-            task_id = cleaner.start_clean(params)
+            # 复用全局清洗器实例，编译好的敏感词模式可跨任务复用
+            task_id = self.data_cleaner.start_clean(params)
             
             return f"✅ 清洗任务已启动！\n任务ID: {task_id}\n请查看控制台日志获取详细进度。"
                 
@@ -429,27 +576,14 @@ class ProcessTabManager:
             if not text or not text.strip():
                 return "⚠️ 请输入要预览的文本"
             
-            cleaner = self.data_cleaner.DataCleaner()
+            cleaner = self.data_cleaner
             words = [w.strip() for w in (sensitive_words or '').split(',') if w.strip()] or cleaner.default_sensitive_words
             
             data = {'preview': text}
             allowed = [f.strip() for f in sensitive_fields.split(',') if f.strip()] if sensitive_fields else None
             exclude = [f.strip() for f in sensitive_exclude_fields.split(',') if f.strip()] if sensitive_exclude_fields else None
             
-            mapping = {}
-            if field_policies and field_policies.strip():
-                for seg in field_policies.split(','):
-                    seg = seg.strip()
-                    if not seg:
-                        continue
-                    parts = seg.split(':')
-                    if len(parts) >= 2:
-                        fld = parts[0].strip()
-                        act = parts[1].strip()
-                        repl = None
-                        if len(parts) >= 3:
-                            repl = ':'.join(parts[2:]).strip()
-                        mapping[fld] = (act, repl)
+            mapping = cleaner.parse_field_policies(field_policies)
             
             # 统计容器模拟
             stats = {'sensitive_detail': {'field_hits': {}, 'word_hits': {}}}
@@ -477,14 +611,15 @@ class ProcessTabManager:
                 return "✅ 未命中任何敏感词\n\n原文本:\n" + text
             
             detail = stats['sensitive_detail']
-            return (
-                "🎯 命中敏感词预览\n" +
-                f"动作: {action}\n\n" +
-                "原文本:\n" + text + "\n\n" +
-                "处理后:\n" + new_text + "\n\n" +
-                "字段命中统计:" + json.dumps(detail['field_hits'], ensure_ascii=False) + "\n" +
-                "词条命中统计:" + json.dumps(detail['word_hits'], ensure_ascii=False)
-            )
+            parts = [
+                "🎯 命中敏感词预览\n",
+                "动作: ", str(action), "\n\n",
+                "原文本:\n", text, "\n\n",
+                "处理后:\n", new_text, "\n\n",
+                "字段命中统计:", json.dumps(detail['field_hits'], ensure_ascii=False), "\n",
+                "词条命中统计:", json.dumps(detail['word_hits'], ensure_ascii=False)
+            ]
+            return "".join(parts)
             
         except Exception as e:
             return f"预览失败: {str(e)}"
@@ -513,14 +648,14 @@ class ProcessTabManager:
                             label="目标格式",
                             info="选择转换后的格式"
                         )
-                        convert_target.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.convert_target", x), inputs=[convert_target])
+                        convert_target.change(lambda x: self._defer_cfg_update("ui_state.process.convert_target", x), inputs=[convert_target])
                         
                         convert_output_dir = gr.Textbox(
                             label="输出目录",
                             value=self.launcher.config_manager.get_config("ui_state.process.convert_output_dir", str(self.launcher.root_dir / "processed")),
                             info="转换结果保存路径"
                         )
-                        convert_output_dir.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.convert_output_dir", x), inputs=[convert_output_dir])
+                        convert_output_dir.change(lambda x: self._defer_cfg_update("ui_state.process.convert_output_dir", x), inputs=[convert_output_dir])
                         
                         convert_btn = gr.Button("开始转换", variant="primary")
                         refresh_convert_btn = gr.Button("刷新任务", size="sm")
@@ -537,13 +672,6 @@ class ProcessTabManager:
                             elem_classes="convert-task-table"
                         )
                         
-                        # 定时刷新任务列表 (每2秒刷新一次)
-                        refresh_timer = gr.Timer(value=2)
-                        refresh_timer.tick(
-                            fn=self._get_convert_tasks_df,
-                            outputs=[convert_task_list]
-                        )
-                        
                         with gr.Row():
                             selected_convert_task = gr.Textbox(
                                 label="选中任务",
@@ -609,7 +737,7 @@ class ProcessTabManager:
                             value=self.launcher.config_manager.get_config("ui_state.process.extract_output_dir", str(self.launcher.root_dir / "processed")),
                             info="提取结果保存路径"
                         )
-                        extract_output_dir.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.extract_output_dir", x), inputs=[extract_output_dir])
+                        extract_output_dir.change(lambda x: self._defer_cfg_update("ui_state.process.extract_output_dir", x), inputs=[extract_output_dir])
                         
                         extract_btn = gr.Button("开始提取", variant="primary")
                     
@@ -670,21 +798,21 @@ class ProcessTabManager:
                             label="合并模式",
                             info="均衡打散合并: 所有文件数据混合打散后合并; 追加合并: 按文件顺序依次追加"
                         )
-                        merge_mode.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.merge_mode", x), inputs=[merge_mode])
+                        merge_mode.change(lambda x: self._defer_cfg_update("ui_state.process.merge_mode", x), inputs=[merge_mode])
                         
                         merge_output_filename = gr.Textbox(
                             label="输出文件名",
                             value=self.launcher.config_manager.get_config("ui_state.process.merge_output_filename", "merged_dataset.jsonl"),
                             info="合并后的文件名"
                         )
-                        merge_output_filename.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.merge_output_filename", x), inputs=[merge_output_filename])
+                        merge_output_filename.change(lambda x: self._defer_cfg_update("ui_state.process.merge_output_filename", x), inputs=[merge_output_filename])
 
                         merge_output_dir = gr.Textbox(
                             label="输出目录",
                             value=self.launcher.config_manager.get_config("ui_state.process.merge_output_dir", str(self.launcher.root_dir / "processed")),
                             info="合并结果保存路径"
                         )
-                        merge_output_dir.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.merge_output_dir", x), inputs=[merge_output_dir])
+                        merge_output_dir.change(lambda x: self._defer_cfg_update("ui_state.process.merge_output_dir", x), inputs=[merge_output_dir])
                         
                         merge_btn = gr.Button("开始合并", variant="primary")
                     
@@ -718,7 +846,7 @@ class ProcessTabManager:
                             label="清洗操作",
                             info="选择要执行的清洗操作 (支持多选)"
                         )
-                        clean_operations.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.clean_operations", x), inputs=[clean_operations])
+                        clean_operations.change(lambda x: self._defer_cfg_update("ui_state.process.clean_operations", x), inputs=[clean_operations])
                         
                         clean_empty_fields = gr.Textbox(
                             label="去空字段（可选）",
@@ -726,7 +854,7 @@ class ProcessTabManager:
                             info="指定检查空值的字段，逗号分隔",
                             value=self.launcher.config_manager.get_config("ui_state.process.clean_empty_fields", "")
                         )
-                        clean_empty_fields.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.clean_empty_fields", x), inputs=[clean_empty_fields])
+                        clean_empty_fields.change(lambda x: self._defer_cfg_update("ui_state.process.clean_empty_fields", x), inputs=[clean_empty_fields])
 
                         clean_empty_mode = gr.Radio(
                             choices=["any", "all"],
@@ -741,7 +869,7 @@ class ProcessTabManager:
                             info="指定敏感词，逗号分隔",
                             value=self.launcher.config_manager.get_config("ui_state.process.clean_sensitive_words", "")
                         )
-                        clean_sensitive_words.change(lambda x: self.launcher.config_manager.update_config("ui_state.process.clean_sensitive_words", x), inputs=[clean_sensitive_words])
+                        clean_sensitive_words.change(lambda x: self._defer_cfg_update("ui_state.process.clean_sensitive_words", x), inputs=[clean_sensitive_words])
 
                         clean_sensitive_fields = gr.Textbox(
                             label="敏感词扫描字段（可选）",
@@ -786,27 +914,7 @@ class ProcessTabManager:
                         )
 
                         with gr.Accordion("敏感词规则说明", open=False):
-                            gr.Markdown(
-                                """
-**匹配模式说明**
-
-1. 普通模式：按提供的词条逐一精确子串匹配（默认忽略大小写，除非勾选大小写敏感）。
-2. 正则模式：勾选“敏感词使用正则模式”后，列表中每一项视为一个正则表达式，支持分组与量词。
-3. 字段白名单 / 排除：
-   - “敏感词扫描字段”填写后，仅这些字段会被检测。
-   - “敏感词排除字段”优先生效，可排除部分字段。
-4. 字段级策略优先级：字段策略 > 全局动作。格式: `字段:动作[:替换]`；动作支持 `drop_record|remove_word|replace_word`。
-5. 统计信息：清洗完成后报告中 `sensitive_detail.field_hits` 记录各字段命中次数，`word_hits` 记录各词命中次数。`unused_parameters` 可帮助确认未生效的多余参数。
-6. Drop Record 提前：一旦某字段策略或全局动作触发 `drop_record` 且匹配命中，该记录立即丢弃，不再继续替换其它字段。
-
-**示例**
-```
-敏感词列表: 密钥,密码
-字段级策略: instruction:remove_word,note:replace_word:[SENSITIVE]
-```
-表示 instruction 删除词本身，note 用 [SENSITIVE] 替换。
-                                """
-                            )
+                            gr.Markdown(SENSITIVE_RULES_HELP_MD)
 
                         gr.Markdown("### 敏感词试运行 (不落地文件)")
                         sensitive_preview_text = gr.Textbox(
@@ -847,30 +955,7 @@ class ProcessTabManager:
                         )
 
                         with gr.Accordion("文本标准化说明", open=False):
-                            gr.Markdown(
-                                """
-**各选项含义与场景**
-
-1. `unicode_nfc` 统一等价字符的内部表示（NFC 规范化）。
-    - 解决：同样显示的字符因为分解/组合形式不同导致匹配/去重失败。
-    - 例：`e + ́` -> `é`。
-
-2. `fullwidth` 全角转半角（只作用于字母 / 数字 / 常见英文标点）。
-    - 解决：输入法全角模式 / 网页复制导致的ＡＢＣ１２３，避免匹配失败。
-    - 例：`ＡＢＣ１２３，．／` -> `ABC123,./`。
-
-3. `lowercase` 所有字母转小写。
-    - 适合：后续匹配/去重不关心大小写（如英文普通描述、标签）。
-    - 不推荐：区分大小写有意义（专有名词、代码片段、变量、情感强调）。
-
-4. `collapse_newlines` 折叠多余空行，避免大段空白。
-    - 处理：将连续的空行收缩为 1 行，并清理多余空白；可减少 token / 噪声。
-    - 保留：正常段落的单个换行。
-
-**执行顺序（当前实现）** 先做空白折叠，再按所选模式应用（NFC → 全角 → 小写 → 空行折叠）。
-如需更精细顺序或增加“保留大小写重要字段”白名单，可后续扩展。
-"""
-                            )
+                            gr.Markdown(NORMALIZE_MODES_HELP_MD)
                         
                         clean_btn = gr.Button("开始清洗", variant="primary")
                     
@@ -882,21 +967,25 @@ class ProcessTabManager:
                             show_copy_button=True
                         )
         
-        # 自动刷新定时器
-        auto_refresh_timer = gr.Timer(value=2)
-        auto_refresh_timer.tick(
-            fn=self._get_convert_tasks_df,
-            outputs=[convert_task_list]
+        # 任务列表定时刷新（仅在本标签页选中时由 UILauncher 开启）；
+        # 每次调用立即返回，任务未变化时跳过渲染
+        convert_refresh_timer = gr.Timer(value=self.launcher.update_interval, active=False)
+        convert_render_sig = gr.State(value=None)
+        convert_refresh_timer.tick(
+            fn=self._tick_convert_tasks,
+            inputs=[convert_render_sig],
+            outputs=[convert_task_list, convert_render_sig],
+            show_progress="hidden"
         )
         
         # 存储组件引用
         self.launcher.components['process'] = {
-            'auto_refresh_timer': auto_refresh_timer,
             'convert_source': convert_source,
             'convert_target': convert_target,
             'convert_output_dir': convert_output_dir,
             'convert_status': convert_status,
             'convert_task_list': convert_task_list,
+            'auto_refresh_timer': convert_refresh_timer,
             'selected_convert_task': selected_convert_task,
             'convert_detail_status': convert_detail_status,
             'extract_source': extract_source,
@@ -942,12 +1031,15 @@ class ProcessTabManager:
         # 新增：异步任务管理事件
         refresh_convert_btn.click(
             fn=self._get_convert_tasks_df,
-            outputs=[convert_task_list]
+            outputs=[convert_task_list],
+            concurrency_limit=self.launcher.refresh_concurrency,
+            concurrency_id="ui_refresh"
         )
         
         convert_task_list.select(
             fn=self._select_convert_task,
-            outputs=[selected_convert_task]
+            outputs=[selected_convert_task],
+            queue=False
         )
         
         view_convert_result_btn.click(
@@ -1004,25 +1096,19 @@ class ProcessTabManager:
         merge_file_list.select(
             fn=on_select_merge_file,
             inputs=[],
-            outputs=[selected_merge_index]
+            outputs=[selected_merge_index],
+            queue=False
         )
         
         def delete_selected_file(selected_idx, df):
             if selected_idx is None or selected_idx < 0:
                 return df
             
-            idx = int(selected_idx)
-            if idx >= len(df):
+            # 按索引从待合并行中移除，表格直接由移除后的行重新生成（无需 drop + reset_index）
+            files = self._remove_merge_file_at(int(selected_idx))
+            if files is None:
                 return df
-
-            # 从列表中移除 (按索引)
-            # 注意：self.merge_file_paths 和 df 必须保持同步
-            if 0 <= idx < len(self.merge_file_paths):
-                self.merge_file_paths.pop(idx)
-            
-            # 从DataFrame中移除
-            new_df = df.drop(idx).reset_index(drop=True)
-            return new_df
+            return self._rows_to_df(files)
 
         delete_file_btn.click(
             fn=delete_selected_file,
@@ -1058,7 +1144,7 @@ class ProcessTabManager:
             outputs=[sensitive_preview_result]
         )
 
-    def _start_field_extract_with_progress(self, source_file, fields, field_mapping_df, output_dir: str):
+    async def _start_field_extract_with_progress(self, source_file, fields, field_mapping_df, output_dir: str):
         """开始字段提取（带进度显示）"""
         try:
             if source_file is None:
@@ -1070,24 +1156,28 @@ class ProcessTabManager:
                 return
 
             source_path = source_file.name
-            if not os.path.exists(source_path):
+            if self._stat_path(source_path, use_cache=True) is None:
                 yield "❌ 源文件不存在"
                 return
 
-            # 进度信息收集
-            progress_log = []
+            # 进度信息收集（增量拼接，推送时无需每次重新 join 整个日志）
+            progress_str = ""
+            
+            def append_log(line: str):
+                nonlocal progress_str
+                progress_str = f"{progress_str}\n{line}" if progress_str else line
             
             def progress_callback(message, percent):
                 """进度回调函数"""
                 timestamp = time.strftime("%H:%M:%S")
                 progress_info = f"[{timestamp}] {percent:3.0f}% - {message}"
-                progress_log.append(progress_info)
+                append_log(progress_info)
                 self.logger.info(progress_info)
 
             try:
                 # 开始提取前的准备工作
                 progress_callback("🚀 开始初始化字段提取任务...", 0)
-                yield "\n".join(progress_log)
+                yield progress_str
                 
                 # 处理字段映射
                 field_mapping = {}
@@ -1103,12 +1193,12 @@ class ProcessTabManager:
                             mapping_data = list(field_mapping_df)
                         
                         progress_callback("✅ 字段映射数据处理完成", 5)
-                        yield "\n".join(progress_log)
+                        yield progress_str
                         
                     except Exception as e:
                         progress_callback(f"⚠️ 映射数据处理异常: {e}", 5)
                         mapping_data = []
-                        yield "\n".join(progress_log)
+                        yield progress_str
                 
                 # 解析映射数据
                 if mapping_data:
@@ -1125,63 +1215,68 @@ class ProcessTabManager:
                     
                     if field_mapping:
                         progress_callback(f"🏷️ 字段重命名映射已设置: {len(field_mapping)} 个字段", 8)
-                        yield "\n".join(progress_log)
+                        yield progress_str
 
                 # 使用通用字段提取器（带进度回调）
                 progress_callback("🔄 启动字段提取引擎...", 10)
-                yield "\n".join(progress_log)
-                
-                # 方案：使用线程运行提取任务，主线程循环yield进度
-                import threading
-                import queue
+                yield progress_str
                 
-                msg_queue = queue.Queue()
-                result_queue = queue.Queue()
+                # 方案：提取任务提交到启动器的提取线程池，进度消息经事件循环投递到 asyncio 队列
+                loop = asyncio.get_running_loop()
+                msg_queue: asyncio.Queue = asyncio.Queue()
+                # 进度消息节流：百分比（取整）变化、到达 100 或进入新阶段（去掉计数后的消息文本变化）时总是推送，
+                # 同一阶段、百分比不变的计数消息最多 10 次/秒，日志条数与数据量无关，阶段性消息也不会丢失
+                last_emit = [0.0, None, None]
                 
                 def thread_callback(message, percent):
+                    now = time.monotonic()
+                    bucket = int(percent)
+                    stage = _PROGRESS_COUNT_RE.sub('', str(message))
+                    if (percent < 100 and bucket == last_emit[1] and stage == last_emit[2]
+                            and now - last_emit[0] < 0.1):
+                        return
+                    last_emit[0], last_emit[1], last_emit[2] = now, bucket, stage
                     timestamp = time.strftime("%H:%M:%S")
                     progress_info = f"[{timestamp}] {percent:3.0f}% - {message}"
-                    msg_queue.put(progress_info)
+                    loop.call_soon_threadsafe(msg_queue.put_nowait, progress_info)
                 
                 def run_extract():
-                    try:
-                        res = extract_fields_universal(
-                            source_path=source_path,
-                            fields=fields,
-                            output_dir=output_dir or str(self.launcher.root_dir / 'processed'),
-                            field_mapping=field_mapping,
-                            progress_callback=thread_callback
-                        )
-                        result_queue.put(('success', res))
-                    except Exception as e:
-                        result_queue.put(('error', str(e)))
-                
-                t = threading.Thread(target=run_extract)
-                t.start()
+                    return extract_fields_universal(
+                        source_path=source_path,
+                        fields=fields,
+                        output_dir=output_dir or str(self.launcher.root_dir / 'processed'),
+                        field_mapping=field_mapping,
+                        progress_callback=thread_callback
+                    )
                 
-                # 循环等待直到线程结束
-                while t.is_alive():
-                    # 获取所有新消息
-                    while not msg_queue.empty():
-                        msg = msg_queue.get()
-                        progress_log.append(msg)
-                    
-                    yield "\n".join(progress_log)
-                    time.sleep(0.1)
+                fut = loop.run_in_executor(self.launcher.extract_pool, run_extract)
+                # 任务结束时投递哨兵；回调在事件循环中执行，排在此前的进度消息之后
+                fut.add_done_callback(lambda _f: msg_queue.put_nowait(None))
                 
-                # 处理剩余消息
-                while not msg_queue.empty():
-                    msg = msg_queue.get()
-                    progress_log.append(msg)
-                yield "\n".join(progress_log)
+                # 等待新消息（有消息立即推送，无消息不空转），收到哨兵即结束
+                finished = False
+                while not finished:
+                    item = await msg_queue.get()
+                    while item is not None:
+                        append_log(item)
+                        # 一并取出已积压的消息，合并为一次推送
+                        if msg_queue.empty():
+                            break
+                        item = msg_queue.get_nowait()
+                    finished = item is None
+                    yield progress_str
                 
                 # 获取结果
-                status, result = result_queue.get()
+                try:
+                    status, result = 'success', await fut
+                except Exception as e:
+                    status, result = 'error', str(e)
 
                 if status == 'success':
                     result_path = result
-                    if result_path and os.path.exists(result_path):
-                        file_size = os.path.getsize(result_path)
+                    result_stat = self._stat_path(result_path) if result_path else None
+                    if result_stat is not None:
+                        file_size = result_stat.st_size
                         
                         # 构建详细的结果报告
                         mapping_info = ""
@@ -1189,8 +1284,7 @@ class ProcessTabManager:
                             mapping_list = [f"{k} → {v}" for k, v in field_mapping.items()]
                             mapping_info = f"\n📋 字段映射: {', '.join(mapping_list)}"
                         
-                        # 合并进度日志
-                        progress_summary = "\n".join(progress_log)
+                        progress_summary = progress_str
                         
                         final_result = f"""✅ 字段提取任务完成！
 
@@ -1207,7 +1301,7 @@ class ProcessTabManager:
                         self.logger.info(f"字段提取完成: {result_path}")
                         yield final_result
                     else:
-                        error_summary = "\n".join(progress_log)
+                        error_summary = progress_str
                         yield f"""❌ 字段提取失败
 
 执行日志:
@@ -1215,12 +1309,12 @@ class ProcessTabManager:
 
 请检查源文件格式和选择的字段"""
                 else:
-                    error_summary = "\n".join(progress_log)
+                    error_summary = progress_str
                     yield f"❌ 字段提取异常: {result}\n\n执行日志:\n{error_summary}"
 
             except Exception as e:
                 self.logger.error(f"字段提取过程异常: {e}")
-                error_summary = "\n".join(progress_log)
+                error_summary = progress_str
                 yield f"❌ 字段提取异常: {str(e)}\n\n执行日志:\n{error_summary}"
                 
         except Exception as e:
@@ -6,9 +6,12 @@
 """
 
 import os
+import atexit
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Dict, Optional
 import gradio as gr
 
 # 基础支撑层导入
@@ -27,6 +30,94 @@ from .ui.model_tab import create_model_tab
 from .ui.distill_tab import create_distill_tab
 from .ui.manage_tab import create_manage_tab
 
+# token 输入停止后延迟写入配置的时间（秒），避免每次按键都落盘
+TOKEN_FLUSH_DELAY = 0.5
+
+# 界面预览使用的默认配置
+_DEFAULT_PREVIEW_CONFIG = PreviewConfig(
+    max_rows=100,
+    max_files=10,
+    max_text_length=300,
+    max_file_size_mb=500,
+    enable_truncation=True,
+    show_stats=True,
+    include_metadata=True,
+    smart_columns=True,
+    show_all_columns=False
+)
+
+
+@lru_cache(maxsize=None)
+def _get_shared_previewer() -> DatasetPreviewer:
+    """获取各 UILauncher 实例共用的数据预览器（首次调用时创建）"""
+    return DatasetPreviewer(_DEFAULT_PREVIEW_CONFIG)
+
+
+# 自定义CSS样式（导入时构建一次，launch() 时直接复用）
+_CUSTOM_CSS = """
+/* 全局字体设置 */
+body, button, input, select, textarea, .gradio-container {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif !important;
+}
+
+/* 标题样式优化 */
+h1, h2, h3, h4, h5, h6 {
+    font-weight: 600 !important;
+    color: var(--body-text-color);
+}
+
+/* 按钮样式微调 */
+button.primary {
+    font-weight: 500 !important;
+}
+
+/* 表格样式优化 */
+.dataframe-wrap {
+    border: 1px solid #e5e7eb;
+    border-radius: 6px;
+}
+
+/* 滚动条美化 */
+::-webkit-scrollbar {
+    width: 8px;
+    height: 8px;
+}
+::-webkit-scrollbar-track {
+    background: transparent;
+}
+::-webkit-scrollbar-thumb {
+    background: #d1d5db;
+    border-radius: 4px;
+}
+::-webkit-scrollbar-thumb:hover {
+    background: #9ca3af;
+}
+
+/* 特定表格高度控制 */
+.dataset-list-table .dataframe-wrap {
+    max-height: 400px !important;
+}
+
+.convert-task-table .dataframe-wrap {
+    max-height: 300px !important;
+}
+
+/* 预览表格容器 */
+.preview-table-container {
+    margin-top: 12px;
+    border: 1px solid #e5e7eb;
+    border-radius: 8px;
+    padding: 0;
+    overflow: hidden;
+    background-color: var(--background-fill-primary);
+}
+
+/* 隐藏 Gradio Footer */
+footer {
+    display: none !important;
+}
+"""
+
 class UILauncher:
     """
     UI启动器类
@@ -42,24 +133,18 @@ class UILauncher:
         # 获取配置
         self.root_dir = Path(config_manager.get_config('base.root_dir', './data'))
         self.update_interval = 2  # 状态更新间隔（秒）
+        # 列表刷新/筛选等轻量事件共用的并发上限（concurrency_id="ui_refresh"），
+        # 多个会话可同时刷新，不必像 Gradio 默认那样逐个排队
+        self.refresh_concurrency = 8
         
-        # 初始化数据预览器
-        preview_config = PreviewConfig(
-            max_rows=100,
-            max_files=10,
-            max_text_length=300,
-            max_file_size_mb=500,
-            enable_truncation=True,
-            show_stats=True,
-            include_metadata=True,
-            smart_columns=True,
-            show_all_columns=False
-        )
-        self.dataset_previewer = DatasetPreviewer(preview_config)
-        self.dataset_downloader = DatasetDownloader()
-        self.format_converter = FormatConverter()
-        self.field_extractor = FieldExtractor()
-        self.data_merger = DataMerger()
+        # 各功能模块（下载器、转换器等）在首次访问时创建，见下方属性
+        
+        # 字段提取线程池（复用工作线程，同时限制并发提取任务数）
+        self.extract_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="extract")
+        # 异步事件处理器卸载阻塞调用（连接测试、预览渲染等）共用的线程池，
+        # 与 asyncio 默认线程池分开，避免与 Gradio 自身的工作线程互相争抢
+        self.io_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="ui-io")
+        atexit.register(self.io_pool.shutdown, wait=False)
         
         # 界面组件存储
         self.components = {}
@@ -67,29 +152,82 @@ class UILauncher:
         # 状态管理
         self.merge_file_paths = []  # 存储待合并的文件路径
         
+        # 待写入的 token（平台 -> token），输入空闲后由定时器统一落盘
+        self._pending_tokens: Dict[str, str] = {}
+        self._token_lock = threading.Lock()
+        self._token_flush_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_tokens)
+        # token 读取缓存（平台 -> token），启动时预加载，保存时同步更新
+        self._token_cache: Dict[str, str] = {}
+        for platform in ('huggingface', 'modelscope'):
+            self._get_saved_token(platform)
+        
         self.logger.info('UI启动器初始化完成')
     
+    @property
+    def dataset_previewer(self) -> DatasetPreviewer:
+        """数据预览器（各实例共用）"""
+        return _get_shared_previewer()
+    
+    @cached_property
+    def dataset_downloader(self) -> DatasetDownloader:
+        """数据集下载器"""
+        return DatasetDownloader()
+    
+    @cached_property
+    def format_converter(self) -> FormatConverter:
+        """格式转换器"""
+        return FormatConverter()
+    
+    @cached_property
+    def field_extractor(self) -> FieldExtractor:
+        """字段提取器"""
+        return FieldExtractor()
+    
+    @cached_property
+    def data_merger(self) -> DataMerger:
+        """数据合并器"""
+        return DataMerger()
+    
     def _get_saved_token(self, platform: str) -> str:
         """获取保存的token"""
         try:
-            config_key = f'tokens.{platform}'
-            return config_manager.get_config(config_key, '')
+            with self._token_lock:
+                if platform in self._token_cache:
+                    return self._token_cache[platform]
+            token = config_manager.get_config(f'tokens.{platform}', '')
+            with self._token_lock:
+                return self._token_cache.setdefault(platform, token)
         except Exception as e:
             self.logger.warning(f'获取{platform} token失败: {e}')
             return ''
     
     def _save_token(self, platform: str, token: str):
-        """保存token到配置"""
-        try:
-            if token.strip():
-                config_key = f'tokens.{platform}'
-                config_manager.update_config(config_key, token.strip())
-                self.logger.info(f'{platform} token已保存到配置')
-            else:
-                config_key = f'tokens.{platform}'
-                config_manager.update_config(config_key, '')
-        except Exception as e:
-            self.logger.error(f'保存{platform} token失败: {e}')
+        """记录token修改，输入空闲 TOKEN_FLUSH_DELAY 秒后再写入配置"""
+        with self._token_lock:
+            token = (token or '').strip()
+            self._token_cache[platform] = token
+            self._pending_tokens[platform] = token
+            if self._token_flush_timer is not None:
+                self._token_flush_timer.cancel()
+            self._token_flush_timer = threading.Timer(TOKEN_FLUSH_DELAY, self._flush_tokens)
+            self._token_flush_timer.daemon = True
+            self._token_flush_timer.start()
+    
+    def _flush_tokens(self):
+        """将待写入的token一次性保存到配置（定时器到期或进程退出时调用）"""
+        with self._token_lock:
+            pending, self._pending_tokens = self._pending_tokens, {}
+            if self._token_flush_timer is not None:
+                self._token_flush_timer.cancel()
+                self._token_flush_timer = None
+        for platform, token in pending.items():
+            try:
+                config_manager.update_config(f'tokens.{platform}', token)
+                if token:
+                    self.logger.info(f'{platform} token已保存到配置')
+            except Exception as e:
+                self.logger.error(f'保存{platform} token失败: {e}')
     
     def launch(self, share: bool = False, server_port: int = 7860):
         """启动Gradio界面"""
@@ -106,27 +244,26 @@ class UILauncher:
             # 创建标签页
             with gr.Tabs():
                 # 标签页1：数据集下载
-                with gr.TabItem("📥 数据集下载", id="download"):
+                with gr.TabItem("📥 数据集下载", id="download") as download_tab:
                     self.download_manager = create_download_tab(self)
                 
                 # 标签页2：数据加工
-                with gr.TabItem("🔧 数据加工", id="process"):
+                with gr.TabItem("🔧 数据加工", id="process") as process_tab:
                     self.process_manager = create_process_tab(self)
                 
                 # 标签页3：模型配置
-                with gr.TabItem("⚙️ 模型配置", id="model"):
+                with gr.TabItem("⚙️ 模型配置", id="model") as model_tab:
                     self.model_manager = create_model_tab(self)
                 
                 # 标签页4：蒸馏生成
-                with gr.TabItem("🧠 蒸馏生成", id="distill"):
+                with gr.TabItem("🧠 蒸馏生成", id="distill") as distill_tab:
                     self.distill_manager = create_distill_tab(self)
                 
                 # 标签页5：数据管理
-                with gr.TabItem("📊 数据管理", id="manage"):
+                with gr.TabItem("📊 数据管理", id="manage") as manage_tab:
                     self.manage_manager = create_manage_tab(self)
             
-            # 启动定时任务更新状态
-            self._setup_auto_refresh(demo)
+            self._bind_tab_activation(download_tab, process_tab, model_tab, distill_tab, manage_tab)
         
         # 启动服务器
         self.logger.info(f'启动Gradio服务器，端口: {server_port}')
@@ -137,89 +274,47 @@ class UILauncher:
             show_error=True
         )
     
-    def _get_custom_css(self) -> str:
-        """获取自定义CSS样式"""
-        return """
-        /* 全局字体设置 */
-        body, button, input, select, textarea, .gradio-container {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif !important;
-        }
+    def _bind_tab_activation(self, download_tab, process_tab, model_tab, distill_tab, manage_tab):
+        """按标签页的选中状态加载数据：未打开的页面不在页面加载时扫描，也不在后台轮询"""
+        # 定时刷新只在所属页面选中时运行：每次切换标签页由一个事件统一设置全部定时器的开关
+        download = self.components['download']
+        model = self.components['model']
+        process = self.components['process']
+        distill = self.components['distill']
+        timers = [download['auto_refresh_timer'], model['auto_refresh_timer'],
+                  process['auto_refresh_timer'], distill['auto_refresh_timer']]
         
-        /* 标题样式优化 */
-        h1, h2, h3, h4, h5, h6 {
-            font-weight: 600 !important;
-            color: var(--body-text-color);
-        }
+        def _timer_updates(active_timer=None):
+            return tuple(gr.Timer(active=timer is active_timer) for timer in timers)
         
-        /* 按钮样式微调 */
-        button.primary {
-            font-weight: 500 !important;
-        }
-        
-        /* 表格样式优化 */
-        .dataframe-wrap {
-            border: 1px solid #e5e7eb;
-            border-radius: 6px;
-        }
-        
-        /* 滚动条美化 */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
-        ::-webkit-scrollbar-track {
-            background: transparent; 
-        }
-        ::-webkit-scrollbar-thumb {
-            background: #d1d5db; 
-            border-radius: 4px;
-        }
-        ::-webkit-scrollbar-thumb:hover {
-            background: #9ca3af; 
-        }
-        
-        /* 特定表格高度控制 */
-        .dataset-list-table .dataframe-wrap {
-            max_height: 400px !important;
-        }
-        
-        .convert-task-table .dataframe-wrap {
-            max_height: 300px !important;
-        }
+        # 模型配置：选中时立即刷新列表
+        model_tab.select(
+            fn=lambda: (self.model_manager._get_models_df(),) + _timer_updates(model['auto_refresh_timer']),
+            outputs=[model['model_list']] + timers
+        )
+        download_tab.select(fn=lambda: _timer_updates(download['auto_refresh_timer']), outputs=timers)
+        process_tab.select(fn=lambda: _timer_updates(process['auto_refresh_timer']), outputs=timers)
+        distill_tab.select(fn=lambda: _timer_updates(distill['auto_refresh_timer']), outputs=timers)
+        manage_tab.select(fn=_timer_updates, outputs=timers)
         
-        /* 预览表格容器 */
-        .preview-table-container {
-            margin-top: 12px;
-            border: 1px solid #e5e7eb;
-            border-radius: 8px;
-            padding: 0;
-            overflow: hidden;
-            background-color: var(--background-fill-primary);
-        }
+        # 数据管理：首次打开时才扫描数据集目录（每个页面会话一次，之后由刷新/搜索按钮更新）
+        manage = self.components['manage']
+        datasets_loaded = gr.State(value=False)
         
-        /* 隐藏 Gradio Footer */
-        footer {
-            display: none !important;
-        }
-        """
-
-    def _setup_auto_refresh(self, demo):
-        """设置自动刷新"""
-        def auto_refresh():
-            """自动刷新任务状态"""
-            while True:
-                try:
-                    time.sleep(self.update_interval)
-                    # 只在有组件实例时更新
-                    if hasattr(self, 'components') and self.components:
-                        pass
-                except Exception as e:
-                    self.logger.error(f'自动刷新失败: {e}')
-                    time.sleep(10)
+        def _load_datasets_once(loaded, data_type, search_name, request: gr.Request):
+            if loaded:
+                return gr.skip(), True
+            return self.manage_manager._refresh_datasets(data_type, search_name, request), True
         
-        # 启动后台刷新线程
-        refresh_thread = threading.Thread(target=auto_refresh, daemon=True)
-        refresh_thread.start()
+        manage_tab.select(
+            fn=_load_datasets_once,
+            inputs=[datasets_loaded, manage['data_type_filter'], manage['dataset_name_search']],
+            outputs=[manage['dataset_list'], datasets_loaded]
+        )
+    
+    def _get_custom_css(self) -> str:
+        """获取自定义CSS样式"""
+        return _CUSTOM_CSS
 
 # 全局UI启动器实例
 ui_launcher = UILauncher()
@@ -6,8 +6,11 @@
 支持从大文件中递归提取所有字段，包括深层嵌套的字段。
 """
 
+import copy
 import json
+from functools import lru_cache
 from .dependencies import pd, ijson, HAS_IJSON
+from .utils import json_loads
 from typing import List, Dict, Any, Set, Union, Optional
 import os
 from collections import defaultdict
@@ -426,6 +429,12 @@ class UniversalFieldExtractor:
 _extractor = UniversalFieldExtractor()
 
 
+@lru_cache(maxsize=32)
+def _cached_file_fields(file_path: str, mtime_ns: int, size: int, sample_size: int) -> tuple:
+    """按 (路径, 修改时间, 大小, 采样数) 缓存单个文件的字段信息，文件变化后键随之失效"""
+    return tuple(_extractor.extract_fields_from_file(file_path, sample_size))
+
+
 def extract_fields_universal(source_path: str, fields: List[str], output_dir: str = None, 
                            field_mapping: Dict[str, str] = None, progress_callback=None) -> str:
     """通用字段提取函数（完整版）
@@ -524,7 +533,15 @@ def get_fields_universal(file_path: str, sample_size: int = 100) -> List[Dict[st
     Returns:
         List[Dict]: 字段信息列表
     """
-    return _extractor.extract_fields_from_file(file_path, sample_size)
+    # 目录（如 HuggingFace 数据集）的 mtime 不反映内部文件变化，不走缓存
+    if os.path.isdir(file_path):
+        return _extractor.extract_fields_from_file(file_path, sample_size)
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return _extractor.extract_fields_from_file(file_path, sample_size)
+    # 返回副本，调用方修改结果不影响缓存
+    return copy.deepcopy(list(_cached_file_fields(file_path, st.st_mtime_ns, st.st_size, sample_size)))
 
 
 def _extract_jsonl_fields_with_mapping(source_path: str, fields: List[str], output_path: str, 
@@ -534,14 +551,15 @@ def _extract_jsonl_fields_with_mapping(source_path: str, fields: List[str], outp
         total_lines = _count_lines(source_path)
         processed_lines = 0
         
-        with open(source_path, 'r', encoding='utf-8') as infile, \
+        # 以二进制逐行读取，直接交给 json_loads（可用 orjson 时省去解码）
+        with open(source_path, 'rb') as infile, \
              open(output_path, 'w', encoding='utf-8', newline='\n') as outfile:
             
             for line in infile:
                 line = line.strip()
                 if line:
                     try:
-                        data = json.loads(line)
+                        data = json_loads(line)
                         extracted = {}
                         
                         for field in fields:
@@ -556,7 +574,7 @@ def _extract_jsonl_fields_with_mapping(source_path: str, fields: List[str], outp
                             json_line = json.dumps(extracted, ensure_ascii=False)
                             outfile.write(json_line + '\n')
                             
-                    except json.JSONDecodeError:
+                    except (json.JSONDecodeError, UnicodeDecodeError):
                         continue
                 
                 processed_lines += 1
@@ -705,10 +723,18 @@ def _extract_json_fields_fallback(source_path: str, fields: List[str], output_pa
 
 
 def _count_lines(file_path: str) -> int:
-    """快速计算文件行数"""
+    """快速计算文件行数（按块统计换行符，无需解码）"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return sum(1 for _ in f)
+        count = 0
+        last = b''
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                count += block.count(b'\n')
+                last = block
+        # 最后一行没有换行符时也计为一行
+        if last and not last.endswith(b'\n'):
+            count += 1
+        return count
     except Exception:
         return 0
 
@@ -723,16 +749,20 @@ def _clean_extract_file_ending(file_path: str, file_format: str, encoding: str =
     """
     try:
         if file_format == '.jsonl':
-            # 读取文件内容
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-            
-            # 移除末尾的多余换行符，但保留最后一行的换行符
-            content = content.rstrip('\n') + '\n'
-            
-            # 重写文件，确保使用统一的行终止符
-            with open(file_path, 'w', encoding=encoding, newline='\n') as f:
-                f.write(content)
+            # 移除末尾的多余换行符，但保留最后一行的换行符。
+            # 只从文件末尾向前读取并原地截断，不把整个文件读入内存
+            with open(file_path, 'rb+') as f:
+                end = f.seek(0, os.SEEK_END)
+                while end > 0:
+                    step = min(4096, end)
+                    f.seek(end - step)
+                    stripped = f.read(step).rstrip(b'\n')
+                    end -= step - len(stripped)
+                    if stripped:
+                        break
+                f.truncate(end)
+                f.seek(end)
+                f.write(b'\n')
                 
     except Exception as e:
         print(f"清理提取文件末尾失败: {str(e)}")